@@ -236,6 +236,44 @@
     return Math.min(items.length, 7);
   }
 
+  // Progress history: one append-only JSON-lines log per track, written by sync
+  async function loadProgressLog(track) {
+    try {
+      const res = await fetch(`./data/progress/${encodeURIComponent(track)}.jsonl?ts=${BUST}`, {cache:"no-store"});
+      if (!res.ok) return [];
+      return (await res.text()).split("\n").filter(Boolean).map(line => JSON.parse(line));
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function sparkline(records, width = 160, height = 32) {
+    const max = Math.max(1, ...records.map(r => r.solved));
+    const step = records.length > 1 ? width / (records.length - 1) : 0;
+    const points = records.map((r, i) => `${(i * step).toFixed(1)},${(height - (r.solved / max) * height).toFixed(1)}`).join(' ');
+    return `<svg width="${width}" height="${height}" viewBox="0 0 ${width} ${height}" preserveAspectRatio="none">
+      <polyline points="${points}" fill="none" stroke="var(--accent)" stroke-width="2"/>
+    </svg>`;
+  }
+
+  async function renderProgressHistory() {
+    const el = document.getElementById('progressHistory');
+    if (!el) return;
+    const logs = await Promise.all((data.tracks || []).map(async track => [track, await loadProgressLog(track)]));
+    const rows = logs.filter(([, records]) => records.length).map(([track, records]) => {
+      const last = records[records.length - 1];
+      return `
+        <div class="recent-item">
+          <div class="recent-item-content">
+            <div class="recent-item-title">${escapeHtml(track)}: ${last.solved}/${last.total}</div>
+            <div class="recent-item-meta">since ${escapeHtml(records[0].ts.slice(0, 10))}</div>
+          </div>
+          ${sparkline(records)}
+        </div>`;
+    });
+    el.innerHTML = rows.join('') || '<div class="recent-item-meta">No history yet — run sync.</div>';
+  }
+
   function animateCounter(element, target, duration = 1000) {
     const start = 0;
     const startTime = performance.now();
@@ -360,9 +398,17 @@
             `).join('')}
           </div>
         </div>
+
+        <!-- Progress Over Time -->
+        <div class="chart-card">
+          <h3 class="chart-title">Progress Over Time</h3>
+          <div id="progressHistory" class="recent-list"></div>
+        </div>
       </div>
     `;
 
+    renderProgressHistory();
+
     // Animate counters
     document.querySelectorAll('.animate-count').forEach(el => {
       const target = parseInt(el.getAttribute('data-target') || el.textContent);
@@ -559,6 +605,23 @@
     });
   }
 
+  // Measured complexity from perf/profile.json (via sync)
+  function formatBytes(bytes) {
+    if (bytes < 1024) return `${bytes} B`;
+    if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+    return `${(bytes / 1024 / 1024).toFixed(1)} MB`;
+  }
+
+  function perfText(x) {
+    const perf = x.perf;
+    if (!perf) return '';
+    const parts = [];
+    if (perf.time) parts.push(`⏱ ${perf.time}${perf.time_status === 'mismatch' ? ' ⚠' : ''}`);
+    if (perf.space) parts.push(`💾 ${perf.space}${perf.space_status === 'mismatch' ? ' ⚠' : ''}`);
+    if (perf.peak_bytes !== undefined) parts.push(`peak ${formatBytes(perf.peak_bytes)} @ n=${perf.peak_n}`);
+    return parts.join(' · ');
+  }
+
   function createCard(x, i) {
     const card = document.createElement('div');
     card.className = 'card';
@@ -569,7 +632,7 @@
 
     const meta = document.createElement('div');
     meta.className = 'meta';
-    const metaText = [x.track, (x.type || '').toUpperCase(), x.difficulty || '', x.category || '']
+    const metaText = [x.track, (x.type || '').toUpperCase(), x.difficulty || '', x.category || '', perfText(x)]
       .filter(Boolean).join(' · ');
     meta.textContent = metaText;
 
@@ -637,7 +700,7 @@
     }
 
     if (elements.modalMeta) {
-      const metaText = [item.track, (item.type || '').toUpperCase(), item.difficulty || '', item.category || '', item.link || '']
+      const metaText = [item.track, (item.type || '').toUpperCase(), item.difficulty || '', item.category || '', perfText(item), item.link || '']
         .filter(Boolean).join(' · ');
       elements.modalMeta.textContent = metaText;
     }
@@ -11,24 +11,27 @@ class Solution:
         return " ".join(reversed(s.split())) 
     # In short, split the string by whitespace, reverse the list of words, and join them with a single space.
 
-        """# Alternative approach using two pointers
-        n = len(s)
-        left, right = 0, n - 1
-        # Trim leading spaces
-        while left <= right and s[left] == ' ':
-            left += 1
-        # Trim trailing spaces
-        while left <= right and s[right] == ' ':
-            right -= 1  
-        # Reverse the entire string
-        s = list(s[left:right + 1])
-        reverse(s, 0, len(s) - 1)
-        # Reverse each word in the reversed string
+    def reverseWords__two_pointers(self, s: str) -> str:
+        # Alternative approach using two pointers: collapse spaces,
+        # reverse the entire string, then reverse each word back
+        chars = []
+        for c in s:
+            if c != ' ' or (chars and chars[-1] != ' '):
+                chars.append(c)
+        if chars and chars[-1] == ' ':
+            chars.pop()
+
+        def reverse(left, right):
+            while left < right:
+                chars[left], chars[right] = chars[right], chars[left]
+                left += 1
+                right -= 1
+
+        reverse(0, len(chars) - 1)
         start = 0
-        for i in range(len(s)):
-            if s[i] == ' ':
-                reverse(s, start, i - 1)
+        for i in range(len(chars) + 1):
+            if i == len(chars) or chars[i] == ' ':
+                reverse(start, i - 1)
                 start = i + 1
-        reverse(s, start, len(s) - 1)
-        return ''.join(s)   """
+        return ''.join(chars)
     
\ No newline at end of file
@@ -5,6 +5,7 @@ Time: O() | Space: O()
 Tags: array, greedy
 Link: https://leetcode.com/problems/can-place-flowers/
 """
+from itertools import combinations
 from typing import List
 class Solution:
     def canPlaceFlowers(self, flowerbed: List[int], n: int) -> bool:
@@ -39,6 +40,20 @@ class Solution:
             res = True
         return res
 
+# Stress-test oracle (scripts/stress.py): try every set of empty plots; small inputs only
+def brute_force(flowerbed: List[int], n: int) -> bool:
+    empty = [i for i, v in enumerate(flowerbed) if v == 0]
+    for plots in combinations(empty, n):
+        bed = list(flowerbed)
+        for i in plots:
+            bed[i] = 1
+        if all(not (a and b) for a, b in zip(bed, bed[1:])):
+            return True
+    return False
+
+def is_valid_input(flowerbed: List[int], n: int) -> bool:
+    return len(flowerbed) >= 1 and n >= 0 and all(not (a and b) for a, b in zip(flowerbed, flowerbed[1:]))
+
 
 if __name__ == "__main__":
     s = Solution()
@@ -30,3 +30,15 @@ class Solution:
 
         return ""
 
+# Stress-test oracle (scripts/stress.py): longest prefix of str1 that divides both, by definition
+def brute_force(str1: str, str2: str) -> str:
+    def divides(t, s):
+        return len(s) % len(t) == 0 and t * (len(s) // len(t)) == s
+    best = ""
+    for k in range(1, len(str1) + 1):
+        if divides(str1[:k], str1) and divides(str1[:k], str2):
+            best = str1[:k]
+    return best
+
+def is_valid_input(str1: str, str2: str) -> bool:
+    return len(str1) >= 1 and len(str2) >= 1
@@ -22,13 +22,9 @@ class Solution:
                 res[i] = True
         return res
 
-        
-
-# from typing import List
-# class Solution:
-#     def kidsWithCandies(self, candies: List[int], extraCandies: int) -> List[bool]:
-#         mx = max(candies)
-#         return [candy + extraCandies >= mx for candy in candies]
+    def kidsWithCandies__max(self, candies: List[int], extraCandies: int) -> List[bool]:
+        mx = max(candies)
+        return [candy + extraCandies >= mx for candy in candies]
 
 if __name__ == "__main__":
     s = Solution()
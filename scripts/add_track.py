@@ -4,6 +4,7 @@ Add a new track to your LeetCode grind.
 Usage: python scripts/add_track.py
 """
 import json
+import argparse
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -79,4 +80,5 @@ def main():
     print(f"   2. Use in wizard: ./daily.sh")
 
 if __name__ == "__main__":
+    argparse.ArgumentParser(description="Add a new track (prompts for its details)").parse_args()
     main()
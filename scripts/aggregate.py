@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Combine the dashboards of many forks into one leaderboard and merged index.
+Each input is a clone (uses its docs/data/index.json) or an index.json file,
+optionally labelled as NAME=PATH. Every index is already sorted by
+(track, type, id), so items are streamed and k-way merged: memory stays
+bounded by the number of inputs, not the number of items.
+Usage: python scripts/aggregate.py [--out DIR] [--top 10] alice=../alice-grind bob/index.json ...
+"""
+from __future__ import annotations
+import argparse
+import datetime
+import heapq
+import itertools
+import json
+import os
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_OUT = ROOT / ".cache/aggregate"
+INDEX_REL = Path("docs/data/index.json")
+CHUNK_SIZE = 1 << 16
+ITEMS_START = re.compile(r'"items"\s*:\s*\[')
+
+def sort_key(item: dict) -> tuple:
+    return (item["track"], item["type"], item["id"])
+
+def resolve_input(arg: str) -> tuple[str, Path]:
+    """NAME=PATH or PATH -> (user, index.json path)."""
+    name, sep, path = arg.partition("=")
+    if not sep:
+        name, path = "", arg
+    path = Path(path).expanduser().resolve()
+    index = path / INDEX_REL if path.is_dir() else path
+    if not name:
+        # .../<repo>/docs/data/index.json -> <repo>
+        name = index.parents[2].name if index.parts[-3:] == INDEX_REL.parts else index.stem
+    return name, index
+
+def iter_items(path: Path):
+    """Yield the objects of the top-level "items" array without loading the whole file."""
+    decoder = json.JSONDecoder()
+    with path.open(encoding="utf-8") as f:
+        buf = ""
+        while True:
+            m = ITEMS_START.search(buf)
+            if m:
+                buf = buf[m.end():]
+                break
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            # Keep a short tail in case the key is split across chunks
+            buf = buf[-32:] + chunk
+
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            if pos < len(buf):
+                try:
+                    obj, pos = decoder.raw_decode(buf, pos)
+                    yield obj
+                    continue
+                except json.JSONDecodeError:
+                    pass  # object split across chunks
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                raise ValueError(f"{path}: truncated items array")
+            buf, pos = buf[pos:] + chunk, 0
+
+def user_stream(user: str, path: Path):
+    """Items of one index tagged with `user`, checking the sort order the merge relies on."""
+    last = None
+    for item in iter_items(path):
+        key = sort_key(item)
+        if last is not None and key < last:
+            raise ValueError(f"{path}: items not sorted by (track, type, id) at {key}")
+        last = key
+        yield {**item, "user": user}
+
+def new_stats() -> dict:
+    return {"solved": 0, "tracks": {}, "difficulty": {}}
+
+def count(stats: dict, item: dict) -> None:
+    stats["solved"] += 1
+    stats["tracks"][item["track"]] = stats["tracks"].get(item["track"], 0) + 1
+    difficulty = item.get("difficulty") or "Unknown"
+    stats["difficulty"][difficulty] = stats["difficulty"].get(difficulty, 0) + 1
+
+def aggregate(inputs: list[tuple[str, Path]], out_dir: Path, top: int = 10) -> dict:
+    """Stream-merge every index into out_dir/index.json and return the leaderboard."""
+    streams = [user_stream(user, path) for user, path in inputs]
+    merged = heapq.merge(*streams, key=sort_key)
+
+    users = {user: new_stats() for user, _ in inputs}
+    combined = new_stats()
+    tracks, tags, categories = set(), set(), set()
+    groups = []
+
+    def items_with_stats():
+        # Equal keys are adjacent after the merge, so solver counts need one group at a time
+        for key, group in itertools.groupby(merged, key=sort_key):
+            solvers = []
+            for item in group:
+                count(users[item["user"]], item)
+                tracks.add(item["track"])
+                tags.update(item.get("tags", []))
+                if item.get("category"):
+                    categories.add(item["category"])
+                if item["user"] not in solvers:
+                    solvers.append(item["user"])
+                yield item
+            count(combined, item)
+            groups.append((len(solvers), key, item.get("title", ""), solvers))
+            if len(groups) > top:
+                # Bounded: keep only the current top entries
+                groups[:] = heapq.nlargest(top, groups, key=lambda g: g[0])
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    index_path = out_dir / "index.json"
+    tmp = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write('{\n  "generated_at": %s,\n  "items": [' % json.dumps(
+            datetime.datetime.now(datetime.timezone.utc).isoformat()))
+        for n, item in enumerate(items_with_stats()):
+            f.write(("," if n else "") + "\n    " + json.dumps(item))
+        f.write("\n  ],\n")
+        f.write(f'  "tracks": {json.dumps(sorted(tracks))},\n')
+        f.write(f'  "tags": {json.dumps(sorted(tags))},\n')
+        f.write(f'  "categories": {json.dumps(sorted(categories))},\n')
+        f.write(f'  "users": {json.dumps(sorted(users))}\n}}\n')
+    os.replace(tmp, index_path)
+
+    leaderboard = {
+        "users": dict(sorted(users.items(), key=lambda kv: (-kv[1]["solved"], kv[0]))),
+        "combined": combined,
+        "most_solved": [
+            {"track": key[0], "type": key[1], "id": key[2], "title": title, "solvers": solvers}
+            for _, key, title, solvers in heapq.nlargest(top, groups, key=lambda g: g[0])
+        ],
+    }
+    (out_dir / "leaderboard.json").write_text(json.dumps(leaderboard, indent=2), encoding="utf-8")
+    return leaderboard
+
+def main():
+    p = argparse.ArgumentParser(description="Merge many forks' indexes into a leaderboard")
+    p.add_argument("inputs", nargs="+", help="Clone dir or index.json, optionally NAME=PATH")
+    p.add_argument("--out", type=Path, default=DEFAULT_OUT, help="Output directory (default: .cache/aggregate)")
+    p.add_argument("--top", type=int, default=10, help="Most-solved problems to list")
+    args = p.parse_args()
+
+    inputs = [resolve_input(arg) for arg in args.inputs]
+    missing = [str(path) for _, path in inputs if not path.exists()]
+    if missing:
+        print("❌ Missing index files:\n  " + "\n  ".join(missing))
+        raise SystemExit(1)
+    if len({user for user, _ in inputs}) != len(inputs):
+        print("❌ Duplicate user names; label inputs as NAME=PATH")
+        raise SystemExit(1)
+
+    try:
+        board = aggregate(inputs, args.out, args.top)
+    except (ValueError, json.JSONDecodeError) as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+    print(f"🏆 Leaderboard ({len(inputs)} repos, {board['combined']['solved']} unique problems)\n")
+    for rank, (user, stats) in enumerate(board["users"].items(), 1):
+        per_track = ", ".join(f"{t} {n}" for t, n in sorted(stats["tracks"].items()))
+        print(f"  {rank:>3}. {user:<20} {stats['solved']:>5}  {per_track}")
+    print(f"\n✅ Wrote {args.out / 'index.json'} and {args.out / 'leaderboard.json'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark alternative implementations of a solution side by side.
+Variants are extra Solution methods named <method>__<variant>, e.g.
+reverseWords__two_pointers next to reverseWords. Every variant must return
+the same output on the sidecar cases and the generated inputs; then each is
+timed with timeit autorange + repeats and reported with a 95% confidence interval.
+With --workers > 1 the (size, variant) timings run in a process pool; generated
+inputs are published once to shared memory and workers attach by name.
+Solutions flagged "mutates": true in the sidecar get a fresh copy per call.
+Usage: python scripts/bench.py [paths...] [--sizes 1000 100000] [--repeat 5] [--workers N] [--json]
+"""
+from __future__ import annotations
+import argparse
+import copy
+import json
+import math
+import statistics
+import time
+import timeit
+from functools import lru_cache
+from pathlib import Path
+
+import generators
+import shared_inputs
+import structures
+from run_tests import VARIANT_SEP, case_args, cases_path, discover, display_path, load_cases, load_module, method_variants, normalize, resolve_method
+
+DEFAULT_SIZES = [1_000, 100_000]
+# Two-sided 95% Student t critical values by degrees of freedom
+T_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+        9: 2.262, 10: 2.228, 15: 2.131, 20: 2.086, 30: 2.042}
+
+def t_critical(df: int) -> float:
+    if df > max(T_95):
+        return 1.96
+    return T_95[max(k for k in T_95 if k <= df)]
+
+def fmt_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def time_variant(fn, args: list, repeat: int, mutates: bool = False) -> dict:
+    """Mean seconds per call with a 95% CI over `repeat` autoranged runs.
+    For a mutating solution every call gets its own copy, made before the timed loop."""
+    if mutates:
+        number, _ = timeit.Timer(lambda: fn(*copy.deepcopy(args))).autorange()
+        runs = []
+        for _ in range(repeat):
+            copies = [copy.deepcopy(args) for _ in range(number)]
+            start = time.perf_counter()
+            for call_args in copies:
+                fn(*call_args)
+            runs.append((time.perf_counter() - start) / number)
+    else:
+        timer = timeit.Timer(lambda: fn(*args))
+        number, _ = timer.autorange()
+        runs = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    mean = statistics.fmean(runs)
+    half = t_critical(repeat - 1) * statistics.stdev(runs) / math.sqrt(repeat) if repeat > 1 else 0.0
+    return {"mean": mean, "ci": half, "min": min(runs), "number": number}
+
+@lru_cache(maxsize=None)
+def bound_variant(path: str, name: str):
+    """A Solution method loaded once per worker process."""
+    return getattr(load_module(Path(path)).Solution(), name)
+
+def time_shared(path: str, name: str, handle: dict, repeat: int, mutates: bool) -> dict:
+    """Pool task: time one variant on a shared-memory input."""
+    return time_variant(bound_variant(path, name), shared_inputs.attach(handle), repeat, mutates)
+
+def check_equal(bound: dict, inputs: list[tuple[str, list]], mutates: bool = False) -> list[str]:
+    """Inputs on which some variant disagrees with the main method."""
+    problems = []
+    for label, args in inputs:
+        outputs = {}
+        for name, fn in bound.items():
+            try:
+                outputs[name] = normalize(fn(*(copy.deepcopy(args) if mutates else args)))
+            except Exception as e:
+                outputs[name] = f"{type(e).__name__}: {e}"
+        expected = outputs["main"]
+        for name, got in outputs.items():
+            if got != expected:
+                shown = repr(got) if len(repr(got)) < 80 else repr(got)[:77] + "..."
+                problems.append(f"{label}: {name} returned {shown}")
+    return problems
+
+def bench_file(solution: Path, sizes: list[int], repeat: int, pool=None) -> dict | None:
+    spec = load_cases(solution) if cases_path(solution).exists() else {}
+    module = load_module(solution)
+    if not any(VARIANT_SEP in name and not name.startswith("_") for name in vars(module.Solution)):
+        return None
+    method = resolve_method(module.Solution, spec.get("method"))
+    variants = method_variants(module.Solution, method)
+    if len(variants) < 2:
+        return None
+
+    instance = module.Solution()
+    bound = {label: getattr(instance, name) for label, name in variants.items()}
+    report = {"file": display_path(solution), "method": method, "variants": list(variants), "sizes": []}
+
+    profile = spec.get("profile")
+    gen = generators.get(profile["generator"]) if profile else None
+    rng = generators.Rng(profile.get("seed", 0)) if profile else None
+    generated = [(n, gen(n, rng, **profile.get("kwargs", {}))) for n in sizes] if gen else []
+
+    inputs = [(f"case {i}", structures.build_args(case_args(case), spec.get("structures")))
+              for i, case in enumerate(spec.get("cases", []))]
+    inputs += [(f"n={n}", args) for n, args in generated]
+    mutates = spec.get("mutates", False)
+    report["mismatches"] = check_equal(bound, inputs, mutates)
+    if report["mismatches"] or not generated:
+        return report
+
+    if pool is None:
+        all_timings = [{label: time_variant(fn, args, repeat, mutates) for label, fn in bound.items()}
+                       for _, args in generated]
+    else:
+        with shared_inputs.SharedInputs() as shared:
+            handles = [shared.publish(args) for _, args in generated]
+            futures = [{label: pool.submit(time_shared, str(solution), name, handle, repeat, mutates)
+                        for label, name in variants.items()} for handle in handles]
+            all_timings = [{label: f.result() for label, f in row.items()} for row in futures]
+
+    for (n, _), timings in zip(generated, all_timings):
+        best = min(t["mean"] for t in timings.values())
+        for t in timings.values():
+            t["relative"] = t["mean"] / best
+        report["sizes"].append({"n": n, "timings": timings})
+    return report
+
+def print_table(report: dict) -> None:
+    print(f"\n📊 {report['file']} — {report['method']} ({len(report['variants'])} variants)")
+    if report["mismatches"]:
+        print("   ❌ variants disagree:")
+        for line in report["mismatches"]:
+            print(f"      {line}")
+        return
+    if not report["sizes"]:
+        print("   ✅ outputs agree (add a \"profile\" generator to the sidecar to time them)")
+        return
+
+    width = max(len(v) for v in report["variants"])
+    print(f"   {'n':>9}  {'variant'.ljust(width)}  {'mean':>10}  {'±95% CI':>10}  {'vs best':>8}")
+    for row in report["sizes"]:
+        for i, (label, t) in enumerate(sorted(row["timings"].items(), key=lambda kv: kv[1]["mean"])):
+            n = f"{row['n']:,}" if i == 0 else ""
+            mark = " 🏆" if t["relative"] == 1 else ""
+            print(f"   {n:>9}  {label.ljust(width)}  {fmt_time(t['mean']):>10}  "
+                  f"{'± ' + fmt_time(t['ci']):>10}  {t['relative']:>7.2f}×{mark}")
+
+def main():
+    p = argparse.ArgumentParser(description="Compare a solution's alternative implementations")
+    p.add_argument("paths", nargs="*", type=Path, help="Solution files or directories (default: python/)")
+    p.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="Input sizes to time")
+    p.add_argument("--repeat", type=int, default=5, help="Timed runs per variant and size")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Time (size, variant) pairs in this many processes (default: 1, least noise)")
+    p.add_argument("--json", action="store_true", help="Print the reports as JSON")
+    args = p.parse_args()
+
+    pool = None
+    if args.workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=args.workers)
+    reports = []
+    try:
+        for solution in discover(args.paths):
+            try:
+                report = bench_file(solution, args.sizes, args.repeat, pool)
+            except Exception as e:
+                print(f"💥 {display_path(solution)}: {type(e).__name__}: {e}")
+                continue
+            if report:
+                reports.append(report)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    elif not reports:
+        print("No solutions with variants (name them <method>__<variant>).")
+    for report in reports if not args.json else []:
+        print_table(report)
+    if any(r["mismatches"] for r in reports):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Startup-time budget check for the grind CLI.
+Times `grind.py <command> --help` (every import the command needs, no side
+effects: argparse exits before any work starts) and lists
+the slowest imports from `python -X importtime`.
+Usage: python scripts/bench_startup.py [--budget-ms 50] [--runs 7] [commands...]
+"""
+from __future__ import annotations
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+GRIND = ROOT / "scripts/grind.py"
+DEFAULT_COMMANDS = ["daily", "new", "fetch", "catalog", "sync"]
+
+def time_command(args: list[str], runs: int) -> float:
+    """Best-of-N wall time in ms for a fresh interpreter running `args`."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            cwd=ROOT, stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+def slowest_imports(command: str, top: int = 5) -> list[tuple[float, str]]:
+    """Top-level imports by cumulative time (ms) from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(GRIND), command, "--help"],
+        cwd=ROOT, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only direct imports (no indentation) so nested modules aren't double counted
+        if not name.startswith("  "):
+            rows.append((int(cumulative) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+def main():
+    p = argparse.ArgumentParser(description="Check CLI startup time against a budget")
+    p.add_argument("commands", nargs="*", default=DEFAULT_COMMANDS)
+    p.add_argument("--budget-ms", type=float, default=50.0,
+                   help="Max startup time per command (default: %(default)s)")
+    p.add_argument("--runs", type=int, default=7)
+    args = p.parse_args()
+
+    baseline = time_command(["-c", "pass"], args.runs)
+    print(f"Interpreter baseline: {baseline:.1f} ms\n")
+
+    over = []
+    for command in args.commands:
+        elapsed = time_command([str(GRIND), command, "--help"], args.runs)
+        ok = elapsed <= args.budget_ms
+        mark = "✓" if ok else "✗"
+        print(f"{mark} {command:<10} {elapsed:6.1f} ms  (+{elapsed - baseline:.1f} ms over bare interpreter)")
+        if not ok:
+            over.append(command)
+            for ms, name in slowest_imports(command):
+                print(f"      {ms:6.1f} ms  {name}")
+
+    if over:
+        print(f"\nOver the {args.budget_ms:.0f} ms budget: {', '.join(over)}")
+        raise SystemExit(1)
+    print(f"\nAll commands within {args.budget_ms:.0f} ms.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Local mirror of the LeetCode problem catalog for instant offline lookup.
+Usage:
+  python scripts/catalog.py sync [--full]
+  python scripts/catalog.py lookup <id | slug | partial title>
+"""
+from __future__ import annotations
+import sys
+import re
+import json
+import sqlite3
+import argparse
+import datetime
+from pathlib import Path
+
+CATALOG_DB = Path.home() / '.leetcode_catalog.db'
+GRAPHQL_URL = "https://leetcode.com/graphql"
+PAGE_SIZE = 100
+
+LIST_QUERY = """
+query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
+  questionList(categorySlug: $categorySlug, limit: $limit, skip: $skip, filters: $filters) {
+    totalNum
+    data {
+      questionId
+      questionFrontendId
+      title
+      titleSlug
+      difficulty
+      isPaidOnly
+      topicTags {
+        name
+        slug
+      }
+    }
+  }
+}
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS problems (
+    question_id INTEGER PRIMARY KEY,
+    frontend_id TEXT NOT NULL,
+    slug TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    tags TEXT NOT NULL DEFAULT '',
+    paid_only INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS problems_frontend_id ON problems(frontend_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# External-content FTS index over titles and slugs; kept in sync by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS problems_fts USING fts5(
+    title, slug, content='problems', content_rowid='question_id'
+);
+CREATE TRIGGER IF NOT EXISTS problems_ai AFTER INSERT ON problems BEGIN
+    INSERT INTO problems_fts(rowid, title, slug) VALUES (new.question_id, new.title, new.slug);
+END;
+CREATE TRIGGER IF NOT EXISTS problems_ad AFTER DELETE ON problems BEGIN
+    INSERT INTO problems_fts(problems_fts, rowid, title, slug) VALUES ('delete', old.question_id, old.title, old.slug);
+END;
+CREATE TRIGGER IF NOT EXISTS problems_au AFTER UPDATE ON problems BEGIN
+    INSERT INTO problems_fts(problems_fts, rowid, title, slug) VALUES ('delete', old.question_id, old.title, old.slug);
+    INSERT INTO problems_fts(rowid, title, slug) VALUES (new.question_id, new.title, new.slug);
+END;
+"""
+
+def connect(db_path: Path = CATALOG_DB) -> sqlite3.Connection:
+    """Open the catalog database, creating the schema on first use."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    try:
+        conn.executescript(FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5: lookups fall back to LIKE scans
+        pass
+    return conn
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    """Check whether the FTS index is available."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='problems_fts'"
+    ).fetchone()
+    return row is not None
+
+def row_to_record(row: sqlite3.Row) -> dict:
+    """Convert a catalog row to the record shape used by fetch_leetcode/daily."""
+    return {
+        'id': row['frontend_id'],
+        'question_id': row['question_id'],
+        'title': row['title'],
+        'slug': row['slug'],
+        'difficulty': row['difficulty'],
+        'tags': row['tags'],
+        'paid_only': bool(row['paid_only']),
+    }
+
+def fetch_page(session, skip: int, limit: int = PAGE_SIZE) -> tuple[int, list[dict]]:
+    """Fetch one page of the problem list. Returns (total, questions)."""
+    payload = {
+        "query": LIST_QUERY,
+        "variables": {"categorySlug": "", "skip": skip, "limit": limit, "filters": {}},
+    }
+    response = session.post(GRAPHQL_URL, json=payload, timeout=30)
+    response.raise_for_status()
+    data = response.json()['data']['questionList']
+    return data['totalNum'], data['data']
+
+def upsert_questions(conn: sqlite3.Connection, questions: list[dict]) -> int:
+    """Insert or update a batch of questions. Returns number of rows written."""
+    from fetch_leetcode import normalize_tag
+
+    rows = [
+        (
+            int(q['questionId']),
+            str(q['questionFrontendId']),
+            q['titleSlug'],
+            q['title'],
+            q['difficulty'],
+            ", ".join(normalize_tag(t['name']) for t in q.get('topicTags') or []),
+            int(bool(q.get('isPaidOnly'))),
+        )
+        for q in questions
+    ]
+    conn.executemany(
+        """
+        INSERT INTO problems (question_id, frontend_id, slug, title, difficulty, tags, paid_only)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(question_id) DO UPDATE SET
+            frontend_id=excluded.frontend_id, slug=excluded.slug, title=excluded.title,
+            difficulty=excluded.difficulty, tags=excluded.tags, paid_only=excluded.paid_only
+        """,
+        rows,
+    )
+    return len(rows)
+
+def sync_catalog(full: bool = False, db_path: Path = CATALOG_DB) -> int:
+    """
+    Download the problem list into the local catalog.
+    Incremental by default: only pages past the stored row count are fetched,
+    since new problems are appended to the end of the list.
+    """
+    import requests
+
+    conn = connect(db_path)
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json", "User-Agent": "Mozilla/5.0"})
+
+    stored = conn.execute("SELECT COUNT(*) FROM problems").fetchone()[0]
+    skip = 0 if full else stored
+    total, written = None, 0
+
+    while total is None or skip < total:
+        total, questions = fetch_page(session, skip)
+        if not questions:
+            break
+        with conn:
+            written += upsert_questions(conn, questions)
+        skip += len(questions)
+        print(f"  {min(skip, total)}/{total}", end="\r", flush=True)
+
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_at', ?)",
+            (datetime.datetime.now(datetime.timezone.utc).isoformat(),),
+        )
+    conn.close()
+    return written
+
+def fts_query(text: str) -> str:
+    """Build a prefix FTS5 query from free text ('product except' -> "product"* "except"*)."""
+    words = [w for w in text.replace("-", " ").replace("_", " ").split() if w]
+    return " ".join('"' + w.replace('"', '') + '"*' for w in words)
+
+def lookup(query: str, limit: int = 10, db_path: Path = CATALOG_DB) -> list[dict]:
+    """Resolve a frontend ID, slug or partial title to catalog records."""
+    query = query.strip()
+    if not query or not db_path.exists():
+        return []
+
+    conn = connect(db_path)
+    try:
+        if query.isdigit():
+            rows = conn.execute(
+                "SELECT * FROM problems WHERE frontend_id = ?", (str(int(query)),)
+            ).fetchall()
+            return [row_to_record(r) for r in rows]
+
+        slug = query.strip('/').lower()
+        rows = conn.execute("SELECT * FROM problems WHERE slug = ?", (slug,)).fetchall()
+        if rows:
+            return [row_to_record(r) for r in rows]
+
+        if has_fts(conn) and fts_query(query):
+            rows = conn.execute(
+                """
+                SELECT p.* FROM problems_fts f JOIN problems p ON p.question_id = f.rowid
+                WHERE problems_fts MATCH ? ORDER BY bm25(problems_fts) LIMIT ?
+                """,
+                (fts_query(query), limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT * FROM problems WHERE title LIKE ? ORDER BY question_id LIMIT ?",
+                (f"%{query}%", limit),
+            ).fetchall()
+        return [row_to_record(r) for r in rows]
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+
+def is_slug_like(query: str) -> bool:
+    """Check whether input looks like a URL or a title slug rather than an ID/title."""
+    return 'leetcode.com/' in query or (
+        not query.isdigit() and ' ' not in query.strip() and query.strip('/') == query.strip('/').lower()
+    )
+
+def extract_slug(query: str) -> str:
+    """Extract the problem slug from a URL, or return a bare slug as-is."""
+    url_match = re.search(r'leetcode\.com/problems/([^/]+)', query)
+    if url_match:
+        return url_match.group(1)
+    return query.strip('/')
+
+def find_slug(slug: str, db_path: Path = CATALOG_DB) -> dict | None:
+    """The record with exactly this slug, or None (no fuzzy fallback)."""
+    if not db_path.exists():
+        return None
+    conn = connect(db_path)
+    try:
+        row = conn.execute("SELECT * FROM problems WHERE slug = ?", (slug.strip('/').lower(),)).fetchone()
+        return row_to_record(row) if row else None
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+def resolve(query: str, db_path: Path = CATALOG_DB) -> dict | None:
+    """Return the best catalog match for a query, or None."""
+    matches = lookup(query, limit=1, db_path=db_path)
+    return matches[0] if matches else None
+
+def main():
+    p = argparse.ArgumentParser(description="Local LeetCode problem catalog")
+    sub = p.add_subparsers(dest="command", required=True)
+    sync_p = sub.add_parser("sync", help="Download/refresh the problem list")
+    sync_p.add_argument("--full", action="store_true", help="Re-download every page")
+    look_p = sub.add_parser("lookup", help="Find problems by ID, slug or title")
+    look_p.add_argument("query", nargs="+")
+    look_p.add_argument("--json", action="store_true", help="Print records as JSON")
+    args = p.parse_args()
+
+    if args.command == "sync":
+        print(f"🔄 Syncing catalog into {CATALOG_DB}")
+        try:
+            written = sync_catalog(full=args.full)
+        except ImportError:
+            print("❌ Error: 'requests' library not found")
+            print("Install it with: pip install requests")
+            sys.exit(1)
+        except Exception as e:
+            print(f"\n❌ Sync failed: {e}")
+            sys.exit(1)
+        print(f"\n✅ Catalog synced ({written} problems written)")
+        return
+
+    matches = lookup(" ".join(args.query))
+    if args.json:
+        print(json.dumps(matches, indent=2))
+        return
+    if not matches:
+        print("❌ No match (run `python scripts/catalog.py sync` first?)")
+        sys.exit(1)
+    for m in matches:
+        lock = " 🔒" if m['paid_only'] else ""
+        print(f"{m['id'].zfill(4)}  {m['title']} ({m['slug']}) [{m['difficulty']}]{lock}  {m['tags']}")
+
+if __name__ == "__main__":
+    main()
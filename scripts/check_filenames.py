@@ -1,23 +1,160 @@
 #!/usr/bin/env python3
+"""
+Lint solution filenames and headers.
+Usage:
+  python scripts/check_filenames.py                 # every file under python/ and sql/
+  python scripts/check_filenames.py --staged        # only staged files (pre-commit)
+  python scripts/check_filenames.py --install-hook  # run --staged before each commit
+"""
 from __future__ import annotations
+import argparse
 import re
+import subprocess
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
+SOLUTION_DIRS = {"python": "py", "sql": "sql"}
+# Slugs may be underscore (wizard/CSV) or kebab (fetched from LeetCode)
+NAME_PATTERN = re.compile(r"^(\d{4})_([a-z0-9_-]+)\.(py|sql)$")
+TITLE_PATTERN = re.compile(r"^(\d{4})\s*-\s*(.+?)\s*\((.+?)\)\s*$", re.M)
+REQUIRED_FIELDS = {"py": ("Idea", "Time", "Tags", "Link"), "sql": ("Idea", "Tags", "Link")}
+# Below this many files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 200
+HOOK = """#!/bin/sh
+# Installed by scripts/check_filenames.py --install-hook
+exec python3 scripts/check_filenames.py --staged
+"""
 
-def check_dir(d: Path, ext: str) -> list[str]:
-    pat = re.compile(r"^\d{4}_[a-z0-9_]+\." + re.escape(ext) + r"$")
-    bad_files = []
-    for f in d.rglob("*." + ext):
-        if f.name.startswith("_"):
-            continue
-        if not pat.match(f.name):
-            bad_files.append(str(f))
-    return bad_files
+def is_solution(rel: str) -> bool:
+    parts = rel.split("/")
+    return (
+        len(parts) >= 3
+        and parts[0] in SOLUTION_DIRS
+        and rel.endswith("." + SOLUTION_DIRS[parts[0]])
+        and not parts[-1].startswith("_")
+    )
+
+def header_block(text: str, ext: str) -> str | None:
+    """The header docstring (py) or leading comment block (sql)."""
+    if ext == "py":
+        m = re.match(r'\s*"""(.*?)"""', text, flags=re.S)
+        return m.group(1) if m else None
+    lines = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("--"):
+            lines.append(stripped[2:].strip())
+        elif stripped:
+            break
+    return "\n".join(lines) or None
+
+def field(block: str, label: str) -> str | None:
+    m = re.search(rf"^{label}\s*:\s*(.*)$", block, flags=re.M | re.I)
+    return m.group(1).strip() if m else None
+
+def check_file(rel: str, text: str) -> list[str]:
+    """All problems with one file's name and header (parsed once)."""
+    name = rel.rsplit("/", 1)[-1]
+    m = NAME_PATTERN.match(name)
+    if not m:
+        return [f"{rel}: bad filename (want 0000_slug.{rel.rsplit('.', 1)[-1]})"]
+    file_id, file_slug, ext = m.groups()
+
+    block = header_block(text, ext)
+    if block is None:
+        return [f"{rel}: missing header"]
+
+    errors = []
+    title = TITLE_PATTERN.search(block)
+    if not title:
+        errors.append(f"{rel}: header title line must be '{file_id} - Title (slug)'")
+    else:
+        hdr_id, _, hdr_slug = title.groups()
+        if hdr_id != file_id:
+            errors.append(f"{rel}: header ID {hdr_id} != filename ID {file_id}")
+        if hdr_slug.replace("-", "_") != file_slug.replace("-", "_"):
+            errors.append(f"{rel}: header slug '{hdr_slug}' != filename slug '{file_slug}'")
+
+    for label in REQUIRED_FIELDS[ext]:
+        if field(block, label) is None:
+            errors.append(f"{rel}: missing '{label}:' field")
+
+    link = field(block, "Link")
+    expected = f"https://leetcode.com/problems/{file_slug.replace('_', '-')}/"
+    if link and link != expected:
+        errors.append(f"{rel}: link '{link}' != '{expected}'")
+    return errors
+
+def _check_pair(pair: tuple[str, str]) -> list[str]:
+    return check_file(*pair)
+
+def run_checks(files: list[tuple[str, str]]) -> list[str]:
+    if len(files) < PARALLEL_THRESHOLD:
+        results = map(_check_pair, files)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(_check_pair, files, chunksize=64))
+    return [err for errs in results for err in errs]
+
+def staged_files() -> list[tuple[str, str]]:
+    """(path, staged content) for added/modified solution files, via one cat-file batch."""
+    names = subprocess.run(
+        ["git", "diff", "--cached", "--name-only", "--diff-filter=ACMR", "-z"],
+        cwd=ROOT, capture_output=True, check=True,
+    ).stdout.decode("utf-8").split("\0")
+    paths = [p for p in names if p and is_solution(p)]
+    if not paths:
+        return []
+
+    # Check the staged blobs, not the working tree, so partial staging is linted correctly
+    out = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        cwd=ROOT, input="".join(f":{p}\n" for p in paths).encode("utf-8"),
+        capture_output=True, check=True,
+    ).stdout
+    files, pos = [], 0
+    for path in paths:
+        header_end = out.index(b"\n", pos)
+        size = int(out[pos:header_end].split()[2])
+        start = header_end + 1
+        files.append((path, out[start:start + size].decode("utf-8", errors="replace")))
+        pos = start + size + 1
+    return files
+
+def all_files() -> list[tuple[str, str]]:
+    files = []
+    for top, ext in SOLUTION_DIRS.items():
+        for f in (ROOT / top).rglob("*." + ext):
+            rel = str(f.relative_to(ROOT)).replace("\\", "/")
+            if is_solution(rel):
+                files.append((rel, f.read_text(encoding="utf-8", errors="replace")))
+    return files
+
+def install_hook() -> None:
+    hooks = Path(subprocess.run(
+        ["git", "rev-parse", "--git-path", "hooks"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout.strip())
+    hook = (ROOT / hooks) / "pre-commit"
+    hook.parent.mkdir(parents=True, exist_ok=True)
+    hook.write_text(HOOK, encoding="utf-8")
+    hook.chmod(0o755)
+    print(f"Installed {hook}")
 
 if __name__ == "__main__":
-    bad_files = check_dir(ROOT/"python", "py") + check_dir(ROOT/"sql", "sql")
-    if bad_files:
-        print("Bad filenames:\n" + "\n".join(bad_files))
+    p = argparse.ArgumentParser(description="Lint solution filenames and headers")
+    p.add_argument("--staged", action="store_true", help="Only check files staged for commit")
+    p.add_argument("--install-hook", action="store_true", help="Install as a git pre-commit hook")
+    args = p.parse_args()
+
+    if args.install_hook:
+        install_hook()
+        raise SystemExit(0)
+
+    files = staged_files() if args.staged else all_files()
+    errors = run_checks(files)
+    if errors:
+        print("Lint errors:\n" + "\n".join(errors))
         raise SystemExit(1)
-    print("All filenames OK.")
+    print(f"All files OK ({len(files)} checked).")
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Measure each solution's runtime on growing inputs, fit it to a complexity
+class and compare with the header's declared `Time: O(...)`. With --memory,
+do the same for tracemalloc peak bytes against `Space: O(...)` and list the
+lines with the largest transient allocations.
+Inputs come from the generator named in the .cases.json sidecar:
+  "profile": {"generator": "two_sum", "kwargs": {}, "sizes": [256, 512, ...]}
+Results go to perf/profile.json (merged into docs/data/index.json by sync).
+Usage: python scripts/complexity.py [paths...] [--memory] [--max-call 0.25] [--check]
+"""
+from __future__ import annotations
+import argparse
+import copy
+import datetime
+import gc
+import json
+import math
+import platform
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import generators
+from locks import atomic_write_text
+from run_tests import ROOT, cases_path, discover, display_path, load_cases, load_module, resolve_method
+
+PROFILE_JSON = ROOT / "perf/profile.json"
+DEFAULT_SIZES = [2 ** k for k in range(8, 16)]
+MIN_POINTS = 4
+HOTSPOTS = 5
+
+# Ordered simplest first: on a near-tie the simpler class wins
+CLASSES = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: float(n) ** 2,
+    "O(n^3)": lambda n: float(n) ** 3,
+}
+TIE_TOLERANCE = 1.1
+# Values that vary less than this across the whole size range are constant
+FLAT_RATIO = 1.5
+# Peaks below this are interpreter noise (cached ints, frame locals), not growth
+MEMORY_FLOOR = 1024
+
+DECLARED = {
+    "1": "O(1)",
+    "logn": "O(log n)",
+    "n": "O(n)",
+    "nlogn": "O(n log n)",
+    "n^2": "O(n^2)", "n2": "O(n^2)", "n²": "O(n^2)", "n*n": "O(n^2)",
+    "n^3": "O(n^3)", "n3": "O(n^3)", "n³": "O(n^3)",
+}
+
+def declared_class(text: str, label: str) -> tuple[str | None, bool]:
+    """(class, comparable) for the header's `<label>: O(...)`; (None, False) if blank."""
+    m = re.search(rf"{label}\s*:\s*O\(([^)]*)\)", text)
+    inner = re.sub(r"[\s·]", "", m.group(1)).lower() if m else ""
+    if not inner:
+        return None, False
+    if inner in DECLARED:
+        return DECLARED[inner], True
+    return f"O({m.group(1).strip()})", False
+
+def fit(sizes: list[int], values: list[float]) -> tuple[str, dict[str, float]]:
+    """Best class for values ~ a + b*f(n), by relative (1/y^2-weighted) least squares."""
+    residuals = {}
+    for name, f in CLASSES.items():
+        xs = [f(n) for n in sizes]
+        ws = [1 / max(y, 1e-12) ** 2 for y in values]
+        sw = sum(ws)
+        mx = sum(w * x for w, x in zip(ws, xs)) / sw
+        my = sum(w * y for w, y in zip(ws, values)) / sw
+        sxx = sum(w * (x - mx) ** 2 for w, x in zip(ws, xs))
+        b = max(0.0, sum(w * (x - mx) * (y - my) for w, x, y in zip(ws, xs, values)) / sxx) if sxx else 0.0
+        a = my - b * mx
+        residuals[name] = sum(w * (y - a - b * x) ** 2 for w, x, y in zip(ws, xs, values))
+
+    best = min(residuals.values())
+    choice = next(name for name, r in residuals.items() if r <= best * TIE_TOLERANCE + 1e-12)
+    return choice, residuals
+
+def time_call(fn, args: list, budget: float = 0.02, min_runs: int = 3, max_runs: int = 1000,
+              copy_args: bool = True) -> float:
+    """Median seconds per call. With copy_args each call gets a fresh copy of args (outside
+    the timed region); solutions that don't mutate their input can skip it."""
+    times = []
+    deadline = time.perf_counter() + budget
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while len(times) < min_runs or (time.perf_counter() < deadline and len(times) < max_runs):
+            call_args = copy.deepcopy(args) if copy_args else args
+            start = time.perf_counter()
+            fn(*call_args)
+            times.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return statistics.median(times)
+
+def profile_setup(solution: Path) -> tuple[object, dict, callable, bool] | None:
+    """(bound method, profile spec, generator, mutates) for a solution with a "profile" section.
+    `mutates` comes from the sidecar's "mutates" flag: the method changes its arguments in place."""
+    if not cases_path(solution).exists():
+        return None
+    spec = load_cases(solution)
+    profile = spec.get("profile")
+    if not profile:
+        return None
+    module = load_module(solution)
+    method = getattr(module.Solution(), resolve_method(module.Solution, spec.get("method")))
+    return method, profile, generators.get(profile["generator"]), spec.get("mutates", False)
+
+def measure_memory(fn, args: list) -> tuple[int, int]:
+    """(peak bytes, blocks still allocated) for one call.
+    Arguments are copied before tracing starts, so only the call's own
+    allocations (including its return value) are counted."""
+    call_args = copy.deepcopy(args)
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn(*call_args)
+        _, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - base, blocks
+
+def memory_hotspots(fn, args: list, source: Path, top: int = HOTSPOTS) -> list[dict]:
+    """Lines of `source` ranked by the largest transient allocation made while each ran."""
+    filename = str(source)
+    lines = source.read_text(encoding="utf-8").splitlines()
+    transient: dict[int, int] = {}
+    net: dict[int, int] = {}
+    state = {"line": None, "start": 0}
+
+    def close_line():
+        line = state["line"]
+        if line is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            transient[line] = max(transient.get(line, 0), peak - state["start"])
+            net[line] = net.get(line, 0) + max(0, current - state["start"])
+
+    def tracer(frame, event, arg):
+        if frame.f_code.co_filename != filename:
+            return None
+        if event in ("line", "return"):
+            close_line()
+            state["line"] = frame.f_lineno if event == "line" else None
+            state["start"], _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        return tracer
+
+    call_args = copy.deepcopy(args)
+    tracemalloc.start()
+    sys.settrace(tracer)
+    try:
+        fn(*call_args)
+    finally:
+        sys.settrace(None)
+        tracemalloc.stop()
+
+    # A line matters if one run allocates a lot (a sorted copy) or its runs add up (a growing dict)
+    ranked = sorted(transient, key=lambda line: -max(transient[line], net[line]))[:top]
+    return [
+        {"line": line, "code": lines[line - 1].strip(), "peak_bytes": transient[line], "net_bytes": net[line]}
+        for line in ranked if max(transient[line], net[line]) > 0
+    ]
+
+def classify(result: dict, sizes: list[int], values: list[float], declared: str | None, comparable: bool) -> dict:
+    """Fit `values` and compare with the declared class."""
+    if len(sizes) < MIN_POINTS:
+        result.update(fit=None, status="too-few-sizes")
+        return result
+    if max(values) <= FLAT_RATIO * min(values):
+        result["fit"] = "O(1)"
+    else:
+        result["fit"], _ = fit(sizes, values)
+    result["status"] = (
+        "undeclared" if declared is None
+        else "unchecked" if not comparable
+        else "ok" if declared == result["fit"]
+        else "mismatch"
+    )
+    return result
+
+def profile_time(solution: Path, max_call: float) -> dict | None:
+    setup = profile_setup(solution)
+    if setup is None:
+        return None
+    method, profile, gen, mutates = setup
+    rng = generators.Rng(profile.get("seed", 0))
+
+    sizes, seconds = [], []
+    for n in profile.get("sizes", DEFAULT_SIZES):
+        per_call = time_call(method, gen(n, rng, **profile.get("kwargs", {})), copy_args=mutates)
+        sizes.append(n)
+        seconds.append(per_call)
+        if per_call > max_call:
+            break
+
+    declared, comparable = declared_class(solution.read_text(encoding="utf-8"), "Time")
+    result = {"generator": profile["generator"], "sizes": sizes, "seconds": seconds, "declared": declared}
+    return classify(result, sizes, seconds, declared, comparable)
+
+def profile_memory(solution: Path, max_call: float) -> dict | None:
+    setup = profile_setup(solution)
+    if setup is None:
+        return None
+    method, profile, gen, _ = setup
+    rng = generators.Rng(profile.get("seed", 0))
+
+    sizes, peaks, blocks = [], [], []
+    for n in profile.get("sizes", DEFAULT_SIZES):
+        args = gen(n, rng, **profile.get("kwargs", {}))
+        start = time.perf_counter()
+        peak, count = measure_memory(method, args)
+        sizes.append(n)
+        peaks.append(peak)
+        blocks.append(count)
+        # tracemalloc slows calls down; keep the same growth cut-off as timing
+        if time.perf_counter() - start > max_call:
+            break
+
+    declared, comparable = declared_class(solution.read_text(encoding="utf-8"), "Space")
+    result = {"generator": profile["generator"], "sizes": sizes, "peak_bytes": peaks,
+              "blocks": blocks, "declared": declared}
+    classify(result, sizes, [max(p, MEMORY_FLOOR) for p in peaks], declared, comparable)
+    # Line attribution at a mid-sized input: big enough to dominate, cheap to trace
+    hot_n = sizes[len(sizes) // 2]
+    result["hotspots_n"] = hot_n
+    result["hotspots"] = memory_hotspots(method, gen(hot_n, rng, **profile.get("kwargs", {})), solution)
+    return result
+
+def load_profile() -> dict:
+    try:
+        return json.loads(PROFILE_JSON.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"solutions": {}}
+
+def save_profile(results: dict[str, dict], kind: str) -> None:
+    """Merge `kind` results (per solution path) into perf/profile.json."""
+    profile = load_profile()
+    profile["generated_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    profile["python"] = platform.python_version()
+    for path, result in results.items():
+        profile["solutions"].setdefault(path, {})[kind] = result
+    profile["solutions"] = dict(sorted(profile["solutions"].items()))
+    PROFILE_JSON.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(PROFILE_JSON, json.dumps(profile, indent=2) + "\n")
+
+STATUS_MARK = {"ok": "✅", "mismatch": "❌", "undeclared": "⚪", "unchecked": "❔", "too-few-sizes": "⚠️"}
+
+def main():
+    p = argparse.ArgumentParser(description="Fit solution runtimes to complexity classes")
+    p.add_argument("paths", nargs="*", type=Path, help="Solution files or directories (default: python/)")
+    p.add_argument("--max-call", type=float, default=0.25,
+                   help="Stop growing n once one call takes this many seconds")
+    p.add_argument("--memory", action="store_true", help="Profile peak memory against Space: instead of Time:")
+    p.add_argument("--check", action="store_true", help="Exit 1 if any fit contradicts its header")
+    args = p.parse_args()
+
+    kind, profiler = ("memory", profile_memory) if args.memory else ("time", profile_time)
+    results = {}
+    for solution in discover(args.paths):
+        rel = display_path(solution)
+        try:
+            result = profiler(solution, args.max_call)
+        except Exception as e:
+            print(f"💥 {rel}: {type(e).__name__}: {e}")
+            continue
+        if result is None:
+            continue
+        results[rel] = result
+        extra = f", peak {result['peak_bytes'][-1]:,} B" if args.memory else ""
+        print(f"{STATUS_MARK[result['status']]} {rel}: measured {result['fit'] or '?'}, "
+              f"header {result['declared'] or 'O()'}  (n ≤ {result['sizes'][-1]}{extra})")
+        for spot in result.get("hotspots", [])[:3]:
+            print(f"     line {spot['line']:>3}  peak {spot['peak_bytes']:>9,} B  total {spot['net_bytes']:>9,} B  {spot['code']}")
+
+    save_profile(results, kind)
+    print(f"\n📈 Wrote {display_path(PROFILE_JSON)}")
+    if args.check and any(r["status"] == "mismatch" for r in results.values()):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
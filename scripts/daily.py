@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 """
 Interactive CLI wizard for hassle-free daily problem solving.
-Usage: python scripts/daily.py
+Usage:
+  python scripts/daily.py
+  python scripts/daily.py --batch manifest.json [--commit] [--push]
 """
 from __future__ import annotations
+import re
 import sys
-import subprocess
+import json
+import argparse
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
 ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT / "scripts"))
 
 try:
     from new import sanitize_path_component, TEMPLATES
@@ -94,6 +100,7 @@ def confirm(question: str, default: bool = True) -> bool:
 
 def run_command(cmd: list[str], description: str) -> bool:
     """Run a command and return success status."""
+    import subprocess
     print(f"\n{colored('⚙', 'yellow')} {description}...")
     try:
         result = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
@@ -121,6 +128,140 @@ def load_fetched_problem():
             return None
     return None
 
+@lru_cache(maxsize=1)
+def search_index():
+    """Load the autocomplete index snapshot once per run."""
+    try:
+        import problem_search
+        return problem_search.load_index()
+    except Exception:
+        return None
+
+def install_completer():
+    """Tab-complete problem IDs/titles at the wizard prompts (needs readline)."""
+    try:
+        import readline
+    except ImportError:
+        return
+
+    matches: list[str] = []
+    def complete(text: str, state: int):
+        if state == 0:
+            # Index loads on the first Tab press, keeping it off the startup path
+            index = search_index()
+            matches[:] = [f"{r['id']} {r['title']}" for r in index.search(text)] if index else []
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer_delims("")
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+
+def resolve_slug(slug: str):
+    """The problem with exactly this slug (local catalog, then the track search index), or None."""
+    try:
+        import catalog
+        record = catalog.find_slug(slug)
+        if record:
+            return record
+    except Exception:
+        pass
+    # Track manifests spell slugs with underscores (product_of_array_except_self)
+    slug = slug.lower().replace('_', '-')
+    index = search_index()
+    hit = next((r for r in index.records if r['slug'].replace('_', '-') == slug), None) if index else None
+    return {**hit, 'id': str(hit['id'])} if hit else None
+
+def resolve_problem(query: str, interactive: bool = False):
+    """
+    Resolve an ID or (partial) title: local catalog first, then the track
+    search index. With interactive=True, ambiguous titles prompt for a pick.
+    URLs and slugs only ever match exactly.
+    """
+    # Accept completed entries like "238 Product of Array Except Self"
+    m = re.match(r"^(\d+)\b", query.strip())
+    if m:
+        query = m.group(1)
+
+    import catalog
+    if catalog.is_slug_like(query):
+        return resolve_slug(catalog.extract_slug(query))
+    try:
+        record = catalog.resolve(query)
+        if record:
+            return record
+    except Exception:
+        pass
+
+    index = search_index()
+    if index is None or not query:
+        return None
+    if query.isdigit():
+        hits = [r for r in [index.get(int(query))] if r]
+    else:
+        hits = index.search(query, limit=5)
+    if not hits:
+        return None
+    if len(hits) > 1 and interactive:
+        labels = [f"{r['id']:04d} - {r['title']}" for r in hits] + ["None of these"]
+        picked = choose("Did you mean:", labels)
+        if picked == labels[-1]:
+            return None
+        hits = [hits[labels.index(picked)]]
+    return {**hits[0], 'id': str(hits[0]['id'])}
+
+class Prefetch:
+    """Resolve a URL/slug in a background thread while the wizard keeps prompting."""
+
+    def __init__(self, query: str):
+        self.query = query
+        self._result = None
+        self._done = threading.Event()
+        # Daemon thread: a slow network never blocks Ctrl-C or exit
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        try:
+            self._result = self._fetch(self.query)
+        except BaseException:
+            # fetch_leetcode exits when `requests` is missing; treat as no result
+            self._result = None
+        finally:
+            self._done.set()
+
+    @staticmethod
+    def _fetch(query: str):
+        import catalog
+        if not catalog.is_slug_like(query):
+            return resolve_problem(query)
+        # A URL or slug names one problem: exact local match, else fetch that slug as given
+        slug = catalog.extract_slug(query)
+        record = resolve_slug(slug)
+        if record:
+            return record
+        from fetch_leetcode import fetch_problem_details, problem_summary
+        problem = fetch_problem_details(slug, "meta", quiet=True)
+        return problem_summary(problem) if problem else None
+
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def result(self, timeout: float | None = None):
+        """Wait (up to timeout) for the fetch and return the details or None."""
+        self._done.wait(timeout)
+        return self._result
+
+def select_track() -> str:
+    """Prompt for a track and return its key."""
+    print(colored("\n📚 Select Track:", "bold"))
+    for key, track in TRACKS.items():
+        print(f"  {colored(key, 'yellow')}. {track['display']}")
+
+    while True:
+        track_choice = input(f"{colored('>', 'green')} Enter choice (1-{len(TRACKS)}): ").strip()
+        if track_choice in TRACKS:
+            return TRACKS[track_choice]["name"]
+        print(colored("Invalid choice. Try again.", "red"))
+
 def get_problem_details():
     """Collect problem details from user."""
     print_header()
@@ -135,16 +276,7 @@ def get_problem_details():
         print(f"  Tags: {fetched['tags']}\n")
 
         if confirm("Use these details?", True):
-            print(f"\n{colored('📚 Select Track:', 'bold')}")
-            for key, track in TRACKS.items():
-                print(f"  {colored(key, 'yellow')}. {track['display']}")
-
-            while True:
-                track_choice = input(f"{colored('>', 'green')} Enter choice (1-3): ").strip()
-                if track_choice in TRACKS:
-                    selected_track = TRACKS[track_choice]["name"]
-                    break
-                print(colored("Invalid choice. Try again.", "red"))
+            selected_track = select_track()
 
             file_type = "py" if "sql" not in selected_track else "sql"
 
@@ -159,17 +291,14 @@ def get_problem_details():
                 "tags": fetched['tags'],
             }
 
-    # Track selection
-    print(colored("\n📚 Select Track:", "bold"))
-    for key, track in TRACKS.items():
-        print(f"  {colored(key, 'yellow')}. {track['display']}")
+    install_completer()
 
-    while True:
-        track_choice = input(f"{colored('>', 'green')} Enter choice (1-3): ").strip()
-        if track_choice in TRACKS:
-            selected_track = TRACKS[track_choice]["name"]
-            break
-        print(colored("Invalid choice. Try again.", "red"))
+    # Start fetching right away; track/language prompts overlap the network call
+    query = prompt("LeetCode URL, slug or ID (optional, Enter to type details)", "")
+    prefetch = Prefetch(query) if query else None
+
+    # Track selection
+    selected_track = select_track()
 
     # Type selection
     if "sql" in selected_track:
@@ -181,23 +310,42 @@ def get_problem_details():
     # Problem details
     print(f"\n{colored('📝 Problem Details:', 'bold')}")
 
-    problem_id = prompt("Problem ID (e.g., 1768)", "")
-    while not problem_id.isdigit():
-        print(colored("ID must be a number!", "red"))
+    record = None
+    if prefetch:
+        if not prefetch.ready():
+            print(f"{colored('⏳', 'yellow')} Waiting for {prefetch.query}...")
+        record = prefetch.result(timeout=15)
+        if record:
+            print(f"{colored('✨', 'green')} Auto-filled from LeetCode (press Enter to accept)")
+        else:
+            print(colored("Could not fetch problem; enter details manually.", "yellow"))
+
+    problem_id = prompt("Problem ID or title (e.g., 1768)", record['id'] if record else "")
+    if not record or problem_id != record['id']:
+        record = resolve_problem(problem_id, interactive=True) if problem_id else None
+    while not (record or problem_id.isdigit()):
+        print(colored("ID must be a number (or a known title; Tab completes)!", "red"))
         problem_id = prompt("Problem ID", "")
+        record = resolve_problem(problem_id, interactive=True) if problem_id else None
 
-    problem_title = prompt("Problem Title (e.g., Merge Strings Alternately)", "")
+    if record:
+        print(f"{colored('✨', 'green')} Found: {record['id']} - {record['title']} ({record['difficulty']})")
+        problem_id = record['id']
+
+    problem_title = prompt("Problem Title (e.g., Merge Strings Alternately)", record['title'] if record else "")
 
     # Generate slug from title
-    default_slug = problem_title.lower().replace(" ", "_").replace("-", "_")
-    default_slug = "".join(c for c in default_slug if c.isalnum() or c == "_")
+    default_slug = slug_from(record['slug'] if record else problem_title)
     problem_slug = prompt("Problem Slug", default_slug)
 
-    difficulty = choose("\n⚡ Difficulty:", DIFFICULTIES)
+    if record and record['difficulty'] in DIFFICULTIES:
+        difficulty = record['difficulty']
+    else:
+        difficulty = choose("\n⚡ Difficulty:", DIFFICULTIES)
 
     category = prompt("Category (optional, will auto-detect from tags)", "")
 
-    tags = prompt("Tags (comma-separated, e.g., string, two-pointers)", "")
+    tags = prompt("Tags (comma-separated, e.g., string, two-pointers)", record['tags'] if record else "")
 
     return {
         "track": selected_track,
@@ -210,16 +358,26 @@ def get_problem_details():
         "tags": tags,
     }
 
+def slug_from(text: str) -> str:
+    """Underscore slug from a title or kebab slug ('Two Sum' -> 'two_sum')."""
+    slug = text.lower().replace(" ", "_").replace("-", "_")
+    return "".join(c for c in slug if c.isalnum() or c == "_")
+
+def solution_path(details: dict) -> Path:
+    """Destination path of a problem's solution file."""
+    safe_track = sanitize_path_component(details["track"])
+    safe_slug = sanitize_path_component(details["slug"])
+    if details["type"] == "py":
+        return ROOT / f"python/{safe_track}/{details['id']:04d}_{safe_slug}.py"
+    return ROOT / f"sql/{safe_track}/{details['id']:04d}_{safe_slug}.sql"
+
 def create_problem_file(details: dict):
     """Create solution file with header."""
     try:
-        safe_track = sanitize_path_component(details["track"])
-        safe_slug = sanitize_path_component(details["slug"])
+        dest = solution_path(details)
 
         # Create file
         if details["type"] == "py":
-            tpl = TEMPLATES["py"].get(safe_track)
-            dest = ROOT / f"python/{safe_track}/{details['id']:04d}_{safe_slug}.py"
             header = f'''"""
 {details['id']:04d} - {details['title']} ({details['slug']})
 Idea:
@@ -232,8 +390,6 @@ class Solution:
     pass
 '''
         else:
-            tpl = TEMPLATES["sql"].get(safe_track)
-            dest = ROOT / f"sql/{safe_track}/{details['id']:04d}_{safe_slug}.sql"
             header = f"""-- {details['id']:04d} - {details['title']} ({details['slug']})
 -- Idea:
 -- Tags: {details['tags']}
@@ -254,34 +410,177 @@ class Solution:
 
 def update_csv(details: dict):
     """Add entry to track CSV if not exists."""
-    try:
-        csv_path = ROOT / f"tracks/{details['track']}.csv"
+    return update_csv_batch([details])
+
+def update_csv_batch(entries: list[dict]) -> bool:
+    """Add entries to their track CSVs: one indexed existence check per ID, one append per track."""
+    import csv
+    from locks import track_lock
+    from track_csv import TrackCSV
 
+    by_track: dict[str, list[dict]] = {}
+    for details in entries:
+        by_track.setdefault(details["track"], []).append(details)
+
+    ok = True
+    for track, rows in by_track.items():
+        csv_path = ROOT / f"tracks/{track}.csv"
         if not csv_path.exists():
             print(colored(f"✗ CSV not found: {csv_path}", "red"))
-            return False
-
-        # Check if entry exists
-        content = csv_path.read_text(encoding="utf-8")
-        if f"{details['id']}," in content:
-            print(f"{colored('ℹ', 'yellow')} Entry already exists in CSV")
+            ok = False
+            continue
+        try:
+            with track_lock(track):
+                added, _ = TrackCSV(csv_path).upsert(rows)
+        except (OSError, ValueError, csv.Error) as e:
+            print(colored(f"✗ Failed to update CSV: {e}", "red"))
+            ok = False
+            continue
+        if added:
+            print(f"{colored('✓', 'green')} Added {added} entr{'y' if added == 1 else 'ies'} to {csv_path.name}")
+        if added < len(rows):
+            print(f"{colored('ℹ', 'yellow')} {len(rows) - added} entr{'y' if len(rows) - added == 1 else 'ies'} already in {csv_path.name}")
+    return ok
+
+def stage_paths(paths: list) -> bool:
+    """Stage only the given paths instead of scanning the whole tree with `git add -A`."""
+    rel = sorted({str(Path(p).resolve().relative_to(ROOT)) for p in paths if Path(p).exists()})
+    if not rel:
+        return True
+    return run_command(["git", "add", "--", *rel], f"Staging {len(rel)} file(s)")
+
+def push_changes(background: bool = True) -> bool:
+    """Push now, or hand off to the background push queue and return immediately."""
+    if background:
+        from push_queue import enqueue
+        if enqueue():
+            print(f"\n{colored('⇡', 'yellow')} Pushing in background (status shown on next run)")
             return True
+        print(colored("Could not start background push; pushing now.", "yellow"))
+    return run_command(["git", "push"], "Pushing to remote")
 
-        # Add entry
-        csv_line = f"{details['id']},{details['title']},{details['slug']},{details['difficulty']},{details['category']},\"{details['tags']}\"\n"
+def report_background_push():
+    """Show the outcome of the previous run's background push, once."""
+    try:
+        from push_queue import pending_report
+        message = pending_report()
+    except Exception:
+        return
+    if message:
+        print(colored(message, "green" if message.startswith("✓") else "red"))
+
+def sync_problem(details: dict, file_path: str) -> list[Path]:
+    """Incrementally sync the track and index entry for one new file, in-process."""
+    print(f"\n{colored('⚙', 'yellow')} Syncing {details['track']}...")
+    try:
+        from sync_all import sync_track
+        start = time.perf_counter()
+        written = sync_track(details["track"], Path(file_path))
+        elapsed = (time.perf_counter() - start) * 1000
+        print(colored(f"✓ Success! ({elapsed:.0f} ms)", "green"))
+        return written
+    except (Exception, SystemExit) as e:
+        # sync_all helpers raise SystemExit on unwritable outputs
+        print(colored(f"✗ Sync failed: {e}", "red"))
+        return []
+
+def load_manifest(path: Path) -> list[dict]:
+    """
+    Read a batch manifest into wizard detail dicts.
+    JSON: a list of objects (or {"problems": [...]}); CSV: a header row with
+    track,id,title plus optional slug,difficulty,category,tags,type columns.
+    """
+    import csv
+    if path.suffix.lower() == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        rows = data.get("problems", []) if isinstance(data, dict) else data
+    else:
+        with path.open("r", encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+
+    known_tracks = {t["name"] for t in TRACKS.values()}
+    entries = []
+    for n, row in enumerate(rows, 1):
+        track = str(row.get("track") or "").strip()
+        if track not in known_tracks:
+            raise ValueError(f"entry {n}: unknown track '{track}'")
+        if not str(row.get("id") or "").strip().isdigit() or not row.get("title"):
+            raise ValueError(f"entry {n}: 'id' (number) and 'title' are required")
+        tags = row.get("tags") or ""
+        if isinstance(tags, list):
+            tags = ", ".join(tags)
+        entries.append({
+            "track": track,
+            "type": row.get("type") or ("sql" if "sql" in track else "py"),
+            "id": int(row["id"]),
+            "slug": slug_from(row.get("slug") or row["title"]),
+            "title": str(row["title"]).strip(),
+            "difficulty": row.get("difficulty") or "",
+            "category": row.get("category") or "",
+            "tags": tags,
+        })
+    return entries
+
+def run_batch(manifest: Path, commit: bool = False, push: bool = False) -> bool:
+    """Create every problem in a manifest, then sync and commit once."""
+    try:
+        entries = load_manifest(manifest)
+    except (OSError, ValueError, json.JSONDecodeError) as e:
+        print(colored(f"✗ Invalid manifest: {e}", "red"))
+        return False
 
-        with csv_path.open("a", encoding="utf-8") as f:
-            f.write(csv_line)
+    print(f"\n{colored('📦 Batch:', 'bold')} {len(entries)} problems from {manifest}")
+    paths_by_track: dict[str, list[Path]] = {}
+    csv_entries = []
+    created = 0
+    for details in entries:
+        dest = solution_path(details)
+        if dest.exists():
+            print(f"{colored('ℹ', 'yellow')} Exists: {dest.relative_to(ROOT)}")
+        elif create_problem_file(details):
+            created += 1
+        else:
+            continue
+        paths_by_track.setdefault(details["track"], []).append(dest)
+        csv_entries.append(details)
+    update_csv_batch(csv_entries)
+
+    # One incremental sync per touched track
+    start = time.perf_counter()
+    touched = [p for paths in paths_by_track.values() for p in paths]
+    touched += [ROOT / f"tracks/{track}.csv" for track in paths_by_track]
+    try:
+        from sync_all import sync_track
+        for track, paths in paths_by_track.items():
+            touched += sync_track(track, *paths)
+    except (Exception, SystemExit) as e:
+        print(colored(f"✗ Sync failed: {e}", "red"))
+        return False
+    print(colored(f"✓ Synced {len(paths_by_track)} track(s) in {(time.perf_counter() - start) * 1000:.0f} ms", "green"))
 
-        print(f"{colored('✓', 'green')} Added entry to CSV")
-        return True
+    if commit and created:
+        stage_paths(touched)
+        run_command(["git", "commit", "-m", f"feat: add {created} problems from {manifest.name}"], "Committing changes")
+        if push:
+            push_changes(background=True)
 
-    except Exception as e:
-        print(colored(f"✗ Failed to update CSV: {e}", "red"))
-        return False
+    print(f"\n{colored('🎉 Batch done!', 'green')} {created} created, {len(entries) - created} skipped\n")
+    return True
 
 def main():
     """Main workflow."""
+    p = argparse.ArgumentParser(description="LeetCode daily problem wizard")
+    p.add_argument("--batch", type=Path, metavar="MANIFEST",
+                   help="Create all problems listed in a .json/.csv manifest non-interactively")
+    p.add_argument("--commit", action="store_true", help="Batch mode: commit once at the end")
+    p.add_argument("--push", action="store_true", help="Batch mode: push after committing")
+    args = p.parse_args()
+
+    report_background_push()
+
+    if args.batch:
+        sys.exit(0 if run_batch(args.batch, args.commit, args.push) else 1)
+
     try:
         # Get problem details
         details = get_problem_details()
@@ -306,15 +605,16 @@ def main():
 
         # Update CSV
         update_csv(details)
+        touched = [Path(file_path), ROOT / f"tracks/{details['track']}.csv"]
 
         # Sync
-        if confirm("\nRun sync_all.py to update trackers?", True):
-            run_command([sys.executable, str(ROOT / "scripts/sync_all.py")], "Syncing all tracks")
+        if confirm("\nSync this track (plan, checklist, README, index)?", True):
+            touched += sync_problem(details, file_path)
 
         # Git workflow
         if confirm("\nCommit and push changes?", True):
-            # Git add
-            run_command(["git", "add", "-A"], "Staging changes")
+            # Stage only what this run created or regenerated
+            stage_paths(touched)
 
             # Generate commit message
             commit_msg = f"feat({details['type']}): {details['id']} {details['slug']}"
@@ -333,7 +633,7 @@ def main():
 
             # Push
             if confirm("\nPush to remote?", True):
-                run_command(["git", "push"], "Pushing to remote")
+                push_changes(background=confirm("Push in background?", True))
 
         print(f"\n{colored('🎉 All done!', 'green')} Happy coding! 🚀\n")
         print(f"📂 Open file: {colored(file_path, 'cyan')}")
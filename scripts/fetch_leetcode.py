@@ -1,34 +1,17 @@
 #!/usr/bin/env python3
 """
-Fetch LeetCode problem details from URL or problem slug.
-Usage: python scripts/fetch_leetcode.py <url_or_slug>
+Fetch LeetCode problem details from URL, problem slug, ID or partial title.
+Usage: python scripts/fetch_leetcode.py <url_or_slug_or_id> [--offline] [--profile meta|meta+python|full]
 """
 import sys
-import re
 import json
-try:
-    import requests
-except ImportError:
-    print("❌ Error: 'requests' library not found")
-    print("Install it with: pip install requests")
-    sys.exit(1)
-
-def extract_slug(input_str):
-    """Extract problem slug from URL or return as-is."""
-    # Check if it's a URL
-    url_match = re.search(r'leetcode\.com/problems/([^/]+)', input_str)
-    if url_match:
-        return url_match.group(1)
-    # Otherwise assume it's already a slug
-    return input_str.strip('/')
-
-def fetch_problem_details(slug):
-    """Fetch problem details from LeetCode GraphQL API."""
-    url = "https://leetcode.com/graphql"
+from pathlib import Path
+from collections.abc import Mapping
 
-    query = """
-    query getQuestionDetail($titleSlug: String!) {
-      question(titleSlug: $titleSlug) {
+# GraphQL field sets per query profile.
+# display_problem only needs the metadata and the Python snippet, so the
+# default profile skips `content` (the bulk of the response).
+META_FIELDS = """
         questionId
         questionFrontendId
         title
@@ -37,15 +20,133 @@ def fetch_problem_details(slug):
         topicTags {
           name
           slug
-        }
-        content
+        }"""
+CONTENT_FIELDS = """
+        content"""
+SNIPPET_FIELDS = """
         codeSnippets {
           lang
           code
-        }
+        }"""
+
+QUERY_PROFILES = {
+    "meta": META_FIELDS,
+    "meta+python": META_FIELDS + SNIPPET_FIELDS,
+    "full": META_FIELDS + CONTENT_FIELDS + SNIPPET_FIELDS,
+}
+DEFAULT_PROFILE = "meta+python"
+# A cached payload fetched with a higher-ranked profile covers lower ones
+PROFILE_RANK = {"meta": 0, "meta+python": 1, "full": 2}
+PYTHON_LANGS = ('Python', 'Python3')
+
+# Large fields are stored compressed and only decompressed when read
+PAYLOAD_CACHE = Path.home() / '.leetcode_cache'
+COMPRESSED_FIELDS = ('content', 'codeSnippets')
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+def import_requests():
+    """Import `requests` on first network use; it is slow to import and optional offline."""
+    try:
+        import requests
+    except ImportError:
+        print("❌ Error: 'requests' library not found")
+        print("Install it with: pip install requests")
+        sys.exit(1)
+    return requests
+
+def build_query(profile):
+    """Build the question detail query for a profile."""
+    return """
+    query getQuestionDetail($titleSlug: String!) {
+      question(titleSlug: $titleSlug) {%s
       }
     }
-    """
+    """ % QUERY_PROFILES[profile]
+
+def compress_field(value):
+    """Compress a JSON-serializable value (zstd if installed, else gzip)."""
+    import base64, gzip
+    raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    if zstandard is not None:
+        codec, blob = "zstd", zstandard.ZstdCompressor(level=10).compress(raw)
+    else:
+        codec, blob = "gzip", gzip.compress(raw, compresslevel=9)
+    return {"codec": codec, "data": base64.b64encode(blob).decode("ascii")}
+
+def decompress_field(packed):
+    """Inverse of compress_field."""
+    import base64, gzip
+    blob = base64.b64decode(packed["data"])
+    if packed["codec"] == "zstd":
+        if zstandard is None:
+            raise RuntimeError("payload is zstd-compressed; pip install zstandard")
+        raw = zstandard.ZstdDecompressor().decompress(blob)
+    else:
+        raw = gzip.decompress(blob)
+    return json.loads(raw)
+
+class LazyPayload(Mapping):
+    """Problem payload whose compressed fields are decompressed on first access."""
+
+    def __init__(self, fields, packed):
+        self._fields = dict(fields)
+        self._packed = dict(packed)
+
+    def __getitem__(self, key):
+        if key in self._packed:
+            self._fields[key] = decompress_field(self._packed.pop(key))
+        return self._fields[key]
+
+    def __iter__(self):
+        yield from self._fields
+        yield from self._packed
+
+    def __len__(self):
+        return len(self._fields) + len(self._packed)
+
+def payload_path(slug):
+    """Cache file path for a problem slug."""
+    return PAYLOAD_CACHE / f"{slug}.json"
+
+def save_payload(slug, problem, profile):
+    """Store a fetched payload with large fields compressed."""
+    fields = {k: v for k, v in problem.items() if k not in COMPRESSED_FIELDS}
+    packed = {k: compress_field(problem[k]) for k in COMPRESSED_FIELDS if k in problem}
+    try:
+        PAYLOAD_CACHE.mkdir(parents=True, exist_ok=True)
+        payload_path(slug).write_text(
+            json.dumps({"profile": profile, "fields": fields, "packed": packed}),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        print(f"⚠️  Could not cache payload: {e}")
+
+def load_payload(slug, profile):
+    """Return the cached payload if it was fetched with a covering profile."""
+    path = payload_path(slug)
+    if not path.exists():
+        return None
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if PROFILE_RANK.get(cached.get("profile"), -1) < PROFILE_RANK[profile]:
+        return None
+    return LazyPayload(cached["fields"], cached["packed"])
+
+def fetch_problem_details(slug, profile=DEFAULT_PROFILE, use_cache=True, quiet=False):
+    """Fetch problem details from LeetCode GraphQL API."""
+    if use_cache:
+        cached = load_payload(slug, profile)
+        if cached is not None:
+            return cached
+
+    requests = import_requests()
+    url = "https://leetcode.com/graphql"
 
     headers = {
         "Content-Type": "application/json",
@@ -53,7 +154,7 @@ def fetch_problem_details(slug):
     }
 
     payload = {
-        "query": query,
+        "query": build_query(profile),
         "variables": {"titleSlug": slug}
     }
 
@@ -63,12 +164,20 @@ def fetch_problem_details(slug):
         data = response.json()
 
         if 'data' not in data or not data['data']['question']:
-            print(f"❌ Problem not found: {slug}")
+            if not quiet:
+                print(f"❌ Problem not found: {slug}")
             return None
 
-        return data['data']['question']
+        problem = data['data']['question']
+        if profile == "meta+python":
+            problem['codeSnippets'] = [
+                s for s in problem.get('codeSnippets') or [] if s['lang'] in PYTHON_LANGS
+            ]
+        save_payload(slug, problem, profile)
+        return problem
     except Exception as e:
-        print(f"❌ Error fetching problem: {e}")
+        if not quiet:
+            print(f"❌ Error fetching problem: {e}")
         return None
 
 def normalize_tag(tag):
@@ -106,10 +215,20 @@ def normalize_tag(tag):
     }
     return tag_map.get(tag, tag.lower().replace(" ", "-"))
 
+def problem_summary(problem):
+    """Reduce a fetched payload to the details the wizard needs."""
+    return {
+        'id': problem['questionFrontendId'],
+        'title': problem['title'],
+        'slug': problem['titleSlug'],
+        'difficulty': problem['difficulty'],
+        'tags': ", ".join(normalize_tag(tag['name']) for tag in problem['topicTags'])
+    }
+
 def display_problem(problem):
     """Display problem details in a formatted way."""
-    tags = [normalize_tag(tag['name']) for tag in problem['topicTags']]
-    tags_str = ", ".join(tags)
+    details = problem_summary(problem)
+    tags_str = details['tags']
 
     print("\n" + "="*60)
     print(f"✅ Problem Found!")
@@ -124,7 +243,7 @@ def display_problem(problem):
 
     # Find Python code snippet
     python_snippet = None
-    for snippet in problem.get('codeSnippets', []):
+    for snippet in problem.get('codeSnippets') or []:
         if snippet['lang'] in ['Python', 'Python3']:
             python_snippet = snippet['code']
             break
@@ -150,39 +269,84 @@ def display_problem(problem):
     cmd += f"  --title \"{problem['title']}\""
     print(cmd)
 
+    return details
+
+def catalog_details(record):
+    """Build wizard details from a local catalog record."""
     return {
-        'id': problem['questionFrontendId'],
-        'title': problem['title'],
-        'slug': problem['titleSlug'],
-        'difficulty': problem['difficulty'],
-        'tags': tags_str
+        'id': record['id'],
+        'title': record['title'],
+        'slug': record['slug'],
+        'difficulty': record['difficulty'],
+        'tags': record['tags']
     }
 
+def save_details(details):
+    """Save details to a temp file for the wizard to read."""
+    temp_file = Path.home() / '.leetcode_problem.json'
+    with open(temp_file, 'w') as f:
+        json.dump(details, f)
+    print(f"\n💾 Details saved to: {temp_file}")
+    print("   (daily.py can auto-read these values!)")
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/fetch_leetcode.py <url_or_slug>")
-        print("\nExamples:")
-        print("  python scripts/fetch_leetcode.py https://leetcode.com/problems/two-sum/")
-        print("  python scripts/fetch_leetcode.py two-sum")
-        sys.exit(1)
+    import argparse
+    p = argparse.ArgumentParser(
+        description="Fetch LeetCode problem details",
+        epilog="Examples:\n"
+               "  python scripts/fetch_leetcode.py https://leetcode.com/problems/two-sum/\n"
+               "  python scripts/fetch_leetcode.py two-sum\n"
+               "  python scripts/fetch_leetcode.py 238 --offline\n"
+               "  python scripts/fetch_leetcode.py \"product except\"",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    p.add_argument("query", nargs="+", help="URL, slug, problem ID or partial title")
+    p.add_argument("--offline", action="store_true",
+                   help="Use the local catalog only (see scripts/catalog.py)")
+    p.add_argument("--profile", choices=list(QUERY_PROFILES), default=DEFAULT_PROFILE,
+                   help="Fields to fetch (default: %(default)s)")
+    p.add_argument("--no-cache", action="store_true", help="Ignore cached payloads")
+    args = p.parse_args()
+
+    input_str = " ".join(args.query)
+
+    # Resolve IDs and partial titles through the local catalog (no network)
+    import catalog
+    if catalog.is_slug_like(input_str):
+        # URLs and slugs match exactly: a slug missing from the catalog (say, a problem
+        # newer than the last sync) is fetched as given, never swapped for a fuzzy title hit
+        slug = catalog.extract_slug(input_str)
+        record = catalog.find_slug(slug)
+    else:
+        record = catalog.resolve(input_str)
+        if not record:
+            print(f"❌ No catalog match for: {input_str}")
+            print("   Run `python scripts/catalog.py sync` to build the local catalog.")
+            sys.exit(1)
+        slug = record['slug']
+    if record:
+        print(f"📚 Catalog match: {record['id']} - {record['title']}")
 
-    input_str = sys.argv[1]
-    slug = extract_slug(input_str)
+    # Metadata-only requests are fully served by the catalog
+    if args.offline or (record and args.profile == "meta"):
+        if not record:
+            print(f"❌ Not in local catalog: {slug}")
+            sys.exit(1)
+        save_details(catalog_details(record))
+        return
 
     print(f"🔍 Fetching problem: {slug}")
-    problem = fetch_problem_details(slug)
+    problem = fetch_problem_details(slug, args.profile, use_cache=not args.no_cache)
 
     if problem:
         details = display_problem(problem)
+    elif record:
+        print("↩️  Falling back to local catalog record")
+        details = catalog_details(record)
+    else:
+        return
 
-        # Optionally save to a temp file for the wizard to read
-        import os
-        from pathlib import Path
-        temp_file = Path.home() / '.leetcode_problem.json'
-        with open(temp_file, 'w') as f:
-            json.dump(details, f)
-        print(f"\n💾 Details saved to: {temp_file}")
-        print("   (daily.py can auto-read these values!)")
+    save_details(details)
 
 if __name__ == "__main__":
     main()
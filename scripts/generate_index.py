@@ -3,6 +3,8 @@ from __future__ import annotations
 import json, re, datetime
 from pathlib import Path
 
+from locks import atomic_write_text, outputs_lock
+
 ROOT = Path(__file__).resolve().parents[1]
 OUT = ROOT/"docs/data/index.json"
 
@@ -89,7 +91,8 @@ if __name__ == "__main__":
             "categories": sorted({i.get("category", "") for i in items if i.get("category")}),
             "items": items
         }
-        OUT.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        with outputs_lock():
+            atomic_write_text(OUT, json.dumps(payload, indent=2))
         print(f"Wrote {OUT} ({len(items)} items)")
     except Exception as e:
         print(f"Error generating index: {e}")
@@ -0,0 +1,143 @@
+"""
+Input generators for the profilers: each takes a size n and a seeded RNG
+and returns the argument list for one call.
+
+Solutions pick one in their .cases.json sidecar:
+  "profile": {"generator": "ints_and_int", "kwargs": {"hi": 100}}
+"generator" is a name registered here or a "module:function" path, so
+generators can live anywhere on sys.path. Large arrays and strings are
+built with NumPy when it is installed, falling back to `random`.
+"""
+from __future__ import annotations
+import heapq
+import importlib
+import random
+import string
+from typing import Callable
+
+import structures
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GENERATORS: dict[str, Callable] = {}
+LETTERS = string.ascii_letters
+
+def generator(name: str):
+    """Register a generator under `name`."""
+    def register(fn):
+        GENERATORS[name] = fn
+        return fn
+    return register
+
+def get(name: str) -> Callable:
+    if ":" in name:
+        module, func = name.split(":", 1)
+        return getattr(importlib.import_module(module), func)
+    try:
+        return GENERATORS[name]
+    except KeyError:
+        raise KeyError(f"unknown generator '{name}' (known: {', '.join(sorted(GENERATORS))})") from None
+
+class Rng:
+    """Seeded source of int lists and strings, NumPy-backed when available."""
+
+    def __init__(self, seed: int = 0):
+        self.random = random.Random(seed)
+        self.np = np.random.default_rng(seed) if np is not None else None
+
+    def ints(self, n: int, lo: int = 0, hi: int = 10**9) -> list[int]:
+        if self.np is not None:
+            return self.np.integers(lo, hi, size=n, endpoint=True).tolist()
+        return [self.random.randint(lo, hi) for _ in range(n)]
+
+    def distinct_ints(self, n: int, lo: int = -10**9, hi: int = 10**9) -> list[int]:
+        if self.np is not None:
+            return (self.np.choice(hi - lo + 1, size=n, replace=False) + lo).tolist()
+        return self.random.sample(range(lo, hi + 1), n)
+
+    def text(self, n: int, alphabet: str = LETTERS) -> str:
+        if self.np is not None:
+            codes = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+            return self.np.choice(codes, size=n).tobytes().decode("ascii")
+        return "".join(self.random.choices(alphabet, k=n))
+
+@generator("ints")
+def ints(n: int, rng: Rng, lo: int = 0, hi: int = 10**9) -> list:
+    return [rng.ints(n, lo, hi)]
+
+@generator("ints_and_int")
+def ints_and_int(n: int, rng: Rng, lo: int = 0, hi: int = 100, k: int = 1) -> list:
+    return [rng.ints(n, lo, hi), k]
+
+@generator("two_sum")
+def two_sum(n: int, rng: Rng) -> list:
+    """Distinct values with the only pair at the end (full scan).
+    The target is the sum of the two largest values, placed last, so every earlier pair falls short."""
+    nums = rng.distinct_ints(n)
+    a, b = heapq.nlargest(2, nums)
+    return [[x for x in nums if x != a and x != b] + [b, a], a + b]
+
+@generator("text")
+def text(n: int, rng: Rng, alphabet: str = LETTERS) -> list:
+    return [rng.text(n, alphabet)]
+
+@generator("text_pair")
+def text_pair(n: int, rng: Rng, alphabet: str = LETTERS) -> list:
+    return [rng.text(n, alphabet), rng.text(n, alphabet)]
+
+@generator("words")
+def words(n: int, rng: Rng, word_len: int = 5) -> list:
+    """A sentence of about n characters with irregular spacing."""
+    body = rng.text(n, string.ascii_lowercase)
+    chars = list(body)
+    for i in range(word_len, n, word_len + 1):
+        chars[i] = " "
+    return ["  " + "".join(chars) + "  "]
+
+@generator("repeated_pair")
+def repeated_pair(n: int, rng: Rng, unit: int = 2) -> list:
+    """Two strings built from one repeated unit, lengths ~n and ~n/2."""
+    base = rng.text(unit, "AB")
+    reps = max(1, n // unit)
+    return [base * reps, base * max(1, reps // 2)]
+
+@generator("zeros_and_int")
+def zeros_and_int(n: int, rng: Rng, k: int = 1) -> list:
+    return [[0] * n, k]
+
+@generator("flowerbed")
+def flowerbed(n: int, rng: Rng, density: float = 0.3) -> list:
+    """A valid bed (no two adjacent 1s) of length max(n, 1) and a random flower count."""
+    n = max(1, n)
+    bed = []
+    for _ in range(n):
+        can_plant = not bed or bed[-1] == 0
+        bed.append(1 if can_plant and rng.random.random() < density else 0)
+    return [bed, rng.random.randint(0, (n + 1) // 2 + 1)]
+
+@generator("divisible_pair")
+def divisible_pair(n: int, rng: Rng, alphabet: str = "AB", noise: float = 0.3) -> list:
+    """Two strings repeating a common unit; sometimes one char is changed so they don't."""
+    unit = rng.text(rng.random.randint(1, 3), alphabet)
+    reps = max(1, n // len(unit))
+    a = unit * rng.random.randint(1, reps)
+    b = list(unit * rng.random.randint(1, reps))
+    if rng.random.random() < noise:
+        i = rng.random.randrange(len(b))
+        b[i] = rng.random.choice(alphabet)
+    return [a, "".join(b)]
+
+@generator("linked_list")
+def linked_list(n: int, rng: Rng, lo: int = 0, hi: int = 100) -> list:
+    return [structures.build_list(rng.ints(n, lo, hi))]
+
+@generator("tree")
+def tree(n: int, rng: Rng, lo: int = 0, hi: int = 100, holes: float = 0.0) -> list:
+    """A level-order tree of n values; `holes` is the chance a slot is null (complete tree at 0)."""
+    values = rng.ints(n, lo, hi)
+    if holes:
+        values = [None if i and rng.random.random() < holes else v for i, v in enumerate(values)]
+    return [structures.build_tree(values)]
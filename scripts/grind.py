@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the leetcode-grind scripts.
+Usage: python scripts/grind.py <command> [args...]
+"""
+from __future__ import annotations
+import sys
+
+# command -> (module, summary). A command's module is imported only when it
+# runs, so `grind daily` never pays for requests/sqlite/concurrent.futures.
+COMMANDS = {
+    "daily": ("daily", "Interactive problem wizard (or --batch manifest)"),
+    "new": ("new", "Create one solution file, or --from-track to scaffold a track"),
+    "fetch": ("fetch_leetcode", "Fetch problem details by URL, slug, ID or title"),
+    "catalog": ("catalog", "Sync or query the local problem catalog"),
+    "search": ("problem_search", "Search problems by ID or partial title"),
+    "test": ("run_tests", "Run solution test cases in parallel"),
+    "watch": ("watch", "Re-run a solution's cases on every save"),
+    "complexity": ("complexity", "Fit measured runtimes against headers' Time: O(...)"),
+    "bench": ("bench", "Benchmark a solution's <method>__<variant> alternatives"),
+    "perf-gate": ("perf_gate", "Fail if changed solutions regress vs perf/baselines.json"),
+    "stress": ("stress", "Stress-test solutions against brute-force oracles"),
+    "sync": ("sync_all", "Rebuild plans, checklists, README progress and index"),
+    "progress": ("update_progress", "Update README progress markers"),
+    "add-track": ("add_track", "Add a new track"),
+    "check": ("check_filenames", "Lint solution filenames and headers (--staged for pre-commit)"),
+    "aggregate": ("aggregate", "Merge many forks' indexes into a leaderboard"),
+    "push-status": ("push_queue", "Show the last background push status"),
+    "bench-startup": ("bench_startup", "Check startup time against a budget"),
+}
+
+def usage() -> None:
+    print("Usage: python scripts/grind.py <command> [args...]\n")
+    print("Commands:")
+    width = max(len(name) for name in COMMANDS)
+    for name, (_, summary) in COMMANDS.items():
+        print(f"  {name.ljust(width)}  {summary}")
+    print("\nRun `grind.py <command> --help` for command options.")
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        usage()
+        return 0
+
+    command, *rest = argv
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}\n")
+        usage()
+        return 2
+
+    import runpy
+    sys.argv = [f"grind {command}", *rest]
+    runpy.run_module(COMMANDS[command][0], run_name="__main__", alter_sys=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
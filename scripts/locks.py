@@ -0,0 +1,67 @@
+"""
+Advisory file locks for the sync writers.
+
+Each track has its own lock (tracks/<key>.{csv,json,md}); README.md,
+tracks/problems.json and docs/data/index.json share one "outputs" lock.
+Always take a track lock before the outputs lock, never the reverse.
+On platforms without fcntl the locks are no-ops.
+"""
+from __future__ import annotations
+import os
+import time
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+ROOT = Path(__file__).resolve().parents[1]
+LOCK_DIR = ROOT / ".cache/locks"
+DEFAULT_TIMEOUT = 30.0
+
+class LockTimeout(RuntimeError):
+    pass
+
+@contextmanager
+def file_lock(name: str, timeout: float = DEFAULT_TIMEOUT):
+    """Hold an exclusive advisory lock on .cache/locks/<name>.lock."""
+    if fcntl is None:
+        yield
+        return
+
+    LOCK_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(LOCK_DIR / f"{name}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise LockTimeout(f"timed out waiting for lock '{name}'")
+                time.sleep(0.02)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+def track_lock(track_key: str, timeout: float = DEFAULT_TIMEOUT):
+    """Lock for one track's CSV, plan JSON and checklist."""
+    return file_lock(f"track-{track_key}", timeout)
+
+def outputs_lock(timeout: float = DEFAULT_TIMEOUT):
+    """Lock for outputs shared by all tracks (README markers, problem catalog, index)."""
+    return file_lock("outputs", timeout)
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write via a temp file + rename so readers never see a partial file."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-import argparse, shutil, re
+import argparse, json, os, re, time
+from functools import lru_cache
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -26,16 +27,87 @@ def sanitize_path_component(value: str) -> str:
         raise ValueError(f"Invalid path component: {value}")
     return sanitized
 
+def render_header(file_type: str, pid: int, title: str, slug: str) -> str:
+    """Solution file header block."""
+    if file_type == "py":
+        return f'"""\n{pid:04d} - {title} ({slug})\nIdea: \nTime:  | Space: \nTags: \nLink: https://leetcode.com/problems/{slug.replace("_","-")}/\n"""\n\n'
+    return f"-- {pid:04d} - {title} ({slug})\n-- Idea: \n-- Tags: \n-- Link: https://leetcode.com/problems/{slug.replace('_','-')}/\n\n"
+
+@lru_cache(maxsize=None)
+def read_template(tpl: Path) -> str:
+    """Template text, read once per process."""
+    return tpl.read_text(encoding="utf-8")
+
+def existing_ids(directory: Path) -> set[int]:
+    """IDs of solution files already in a directory (one listing)."""
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return set()
+    return {int(n[:4]) for n in names if n[:4].isdigit() and n[4:5] == "_"}
+
+def scaffold_track(track_key: str, workers: int = 8) -> int:
+    """Create a file for every problem in a track's CSV that has none yet."""
+    registry = json.loads((ROOT / "tracks/registry.json").read_text(encoding="utf-8"))
+    track = next((t for t in registry["tracks"] if t["key"] == track_key), None)
+    if track is None:
+        raise SystemExit(f"Unknown track '{track_key}'. Available: {[t['key'] for t in registry['tracks']]}")
+
+    file_type = "sql" if track.get("dir_sql") and not track.get("dir_py") else "py"
+    base = ROOT / track[f"dir_{file_type}"]
+    tpl = TEMPLATES[file_type].get(track_key) or base / f"_template.{file_type}"
+    if not tpl.exists():
+        raise SystemExit(f"Template not found: {tpl}")
+    template = read_template(tpl)
+
+    import csv
+    with (ROOT / track["csv"]).open("r", encoding="utf-8", newline="") as f:
+        rows = [r for r in csv.DictReader(f) if (r.get("id") or "").strip().isdigit()]
+
+    have = existing_ids(base)
+    jobs = []
+    for row in rows:
+        pid = int(row["id"])
+        if pid in have:
+            continue
+        have.add(pid)
+        slug = sanitize_path_component(row["slug"].strip())
+        dest = base / f"{pid:04d}_{slug}.{file_type}"
+        jobs.append((dest, render_header(file_type, pid, row["title"].strip(), row["slug"].strip()) + template))
+
+    if not jobs:
+        return 0
+    from concurrent.futures import ThreadPoolExecutor
+    base.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda job: job[0].write_text(job[1], encoding="utf-8"), jobs))
+    return len(jobs)
+
 def main():
     p = argparse.ArgumentParser()
-    p.add_argument("--type", choices=["py","sql"], required=True)
+    p.add_argument("--from-track", metavar="KEY",
+                   help="Scaffold every missing problem listed in tracks/<KEY>.csv")
+    p.add_argument("--type", choices=["py","sql"])
     # amazonq-ignore-next-line
-    p.add_argument("--track", required=True)
-    p.add_argument("--id", type=int, required=True)
-    p.add_argument("--slug", required=True)
-    p.add_argument("--title", required=True)
+    p.add_argument("--track")
+    p.add_argument("--id", type=int)
+    p.add_argument("--slug")
+    p.add_argument("--title")
     args = p.parse_args()
 
+    if args.from_track:
+        start = time.perf_counter()
+        try:
+            created = scaffold_track(sanitize_path_component(args.from_track))
+        except (IOError, PermissionError, OSError, ValueError) as e:
+            raise SystemExit(f"File operation failed: {e}")
+        print(f"Created {created} file(s) in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return
+
+    missing = [f"--{name}" for name in ("type", "track", "id", "slug", "title") if getattr(args, name) is None]
+    if missing:
+        p.error(f"the following arguments are required: {', '.join(missing)}")
+
     # Sanitize inputs to prevent path traversal
     safe_track = sanitize_path_component(args.track)
     # amazonq-ignore-next-line
@@ -47,14 +119,12 @@ def main():
         raise SystemExit(f"Unknown track '{args.track}' for type '{args.type}'. Available: {available}")
 
     try:
+        tpl = TEMPLATES[args.type][safe_track]
         if args.type == "py":
-            tpl = TEMPLATES["py"][safe_track]
             dest = ROOT / f"python/{safe_track}/{args.id:04d}_{safe_slug}.py"
-            header = f'"""\n{args.id:04d} - {args.title} ({args.slug})\nIdea: \nTime:  | Space: \nTags: \nLink: https://leetcode.com/problems/{args.slug.replace("_","-")}/\n"""\n\n'
         else:
-            tpl = TEMPLATES["sql"][safe_track]
             dest = ROOT / f"sql/{safe_track}/{args.id:04d}_{safe_slug}.sql"
-            header = f"-- {args.id:04d} - {args.title} ({args.slug})\n-- Idea: \n-- Tags: \n-- Link: https://leetcode.com/problems/{args.slug.replace('_','-')}/\n\n"
+        header = render_header(args.type, args.id, args.title, args.slug)
         
         if not tpl.exists():
             raise SystemExit(f"Template not found: {tpl}")
@@ -65,9 +135,7 @@ def main():
             
         dest.parent.mkdir(parents=True, exist_ok=True)
         try:
-            shutil.copy(tpl, dest)
-            content = dest.read_text(encoding="utf-8")
-            dest.write_text(header + content, encoding="utf-8")
+            dest.write_text(header + read_template(tpl), encoding="utf-8")
         except (IOError, PermissionError, OSError) as e:
             raise SystemExit(f"File operation failed: {e}")
         print(f"Created: {dest}")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Performance regression gate backed by perf/baselines.json.
+Baselines hold, per solution and input size, the median call time and the
+tracemalloc peak. Times are stored in "calibration units" (a fixed
+pure-Python loop timed on the same machine), so a baseline recorded on one
+machine can gate runs on another.
+Usage:
+  python scripts/perf_gate.py                     # gate solutions changed vs HEAD
+  python scripts/perf_gate.py --base main         # ... vs another ref
+  python scripts/perf_gate.py --all --update      # record/approve baselines
+"""
+from __future__ import annotations
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+from pathlib import Path
+
+import generators
+from complexity import measure_memory, profile_setup, time_call
+from locks import atomic_write_text
+from run_tests import ROOT, PYTHON_DIR, discover, display_path
+
+BASELINES = ROOT / "perf/baselines.json"
+GATE_SIZES = [2 ** 10, 2 ** 14]
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.10
+
+def calibrate(rounds: int = 7) -> float:
+    """Median seconds for a fixed interpreter-bound workload (loops, dict and list ops)."""
+    def workload():
+        d, acc = {}, []
+        for i in range(20_000):
+            d[i & 1023] = d.get(i & 1023, 0) + i
+            acc.append(i * 3 % 7)
+        return sum(acc) + len(d)
+    return time_call(workload, [], budget=0.0, min_runs=rounds)
+
+def measure(setup: tuple, sizes: list[int], unit: float) -> tuple[dict, dict]:
+    """({n: {"time": calibrated median, "peak_bytes": peak}}, {n: args}) for a profiled solution."""
+    method, profile, gen, mutates = setup
+    rng = generators.Rng(profile.get("seed", 0))
+    results, inputs = {}, {}
+    for n in sizes:
+        args = inputs[str(n)] = gen(n, rng, **profile.get("kwargs", {}))
+        peak, _ = measure_memory(method, args)
+        results[str(n)] = {"time": time_call(method, args, copy_args=mutates) / unit, "peak_bytes": peak}
+    return results, inputs
+
+def changed_solutions(base: str) -> list[Path]:
+    """Solutions whose source or sidecar differs from `base` (tracked changes plus untracked files)."""
+    def git_lines(*args):
+        out = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        return [line for line in out.splitlines() if line]
+
+    paths = git_lines("diff", "--name-only", base, "--", "python")
+    paths += git_lines("ls-files", "--others", "--exclude-standard", "--", "python")
+    solutions = set()
+    for rel in paths:
+        path = ROOT / rel
+        if rel.endswith(".cases.json"):
+            path = path.with_name(path.name[:-len(".cases.json")] + ".py")
+        if path.exists() and path in discover([path]):
+            solutions.add(path)
+    return sorted(solutions)
+
+def load_baselines() -> dict:
+    try:
+        return json.loads(BASELINES.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"solutions": {}}
+
+def save_baselines(baselines: dict, unit: float) -> None:
+    baselines["recorded_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    baselines["calibration"] = {"seconds": unit, "python": platform.python_version(), "machine": platform.machine()}
+    baselines["solutions"] = dict(sorted(baselines["solutions"].items()))
+    BASELINES.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(BASELINES, json.dumps(baselines, indent=2) + "\n")
+
+def compare(rel: str, measured: dict, baseline: dict, tolerance: float, memory_tolerance: float,
+            retime) -> list[str]:
+    """Regression messages for one solution; `retime(n)` confirms a slow timing before it counts."""
+    regressions = []
+    for n, now in measured.items():
+        before = baseline.get(n)
+        if before is None:
+            continue
+        if now["time"] > before["time"] * (1 + tolerance):
+            # One re-measure: a single noisy run shouldn't fail the gate
+            now["time"] = min(now["time"], retime(n))
+        if now["time"] > before["time"] * (1 + tolerance):
+            regressions.append(f"{rel} n={n}: time {now['time'] / before['time']:.2f}× baseline")
+        if now["peak_bytes"] > before["peak_bytes"] * (1 + memory_tolerance) + 1024:
+            regressions.append(f"{rel} n={n}: peak {now['peak_bytes']:,} B vs {before['peak_bytes']:,} B")
+    return regressions
+
+def main():
+    p = argparse.ArgumentParser(description="Fail when a changed solution is slower than its baseline")
+    p.add_argument("paths", nargs="*", type=Path, help="Gate these solutions instead of the changed ones")
+    p.add_argument("--base", default="HEAD", help="Git ref to diff against (default: HEAD)")
+    p.add_argument("--all", action="store_true", help="Gate every solution under python/")
+    p.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                   help="Allowed slowdown, as a fraction (default: %(default)s)")
+    p.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE,
+                   help="Allowed peak-memory growth, as a fraction (default: %(default)s)")
+    p.add_argument("--update", action="store_true", help="Approve: store the measured values as baselines")
+    args = p.parse_args()
+
+    if args.all:
+        solutions = discover([PYTHON_DIR])
+    elif args.paths:
+        solutions = discover(args.paths)
+    else:
+        solutions = changed_solutions(args.base)
+    if not solutions:
+        print("✅ No changed solutions to gate.")
+        return
+
+    unit = calibrate()
+    print(f"⚙️  Calibration: {unit * 1000:.2f} ms per unit\n")
+    baselines = load_baselines()
+    regressions = []
+    for solution in solutions:
+        rel = display_path(solution)
+        setup = profile_setup(solution)
+        if setup is None:
+            print(f"⚪ {rel}: no profile generator, skipped")
+            continue
+        measured, inputs = measure(setup, GATE_SIZES, unit)
+        baseline = baselines["solutions"].get(rel)
+        if baseline is None:
+            print(f"🆕 {rel}: no baseline" + (" (recording)" if args.update else " (run with --update to record)"))
+        else:
+            retime = lambda n: time_call(setup[0], inputs[n], copy_args=setup[3]) / unit
+            found = compare(rel, measured, baseline, args.tolerance, args.memory_tolerance, retime)
+            regressions += found
+            print(f"{'❌' if found else '✅'} {rel}: " + ", ".join(
+                f"n={n} {m['time'] / baseline[n]['time']:.2f}× time, {m['peak_bytes'] / max(baseline[n]['peak_bytes'], 1):.2f}× peak"
+                for n, m in measured.items() if n in baseline))
+        if args.update:
+            baselines["solutions"][rel] = measured
+
+    if args.update:
+        save_baselines(baselines, unit)
+        print(f"\n📌 Baselines updated in {display_path(BASELINES)}")
+    elif regressions:
+        print("\nRegressions (re-run with --update to approve):\n  " + "\n  ".join(regressions))
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+In-memory problem search index (trigram + ID map) for wizard autocomplete.
+Built from the track CSVs and the local catalog, persisted as a snapshot.
+Usage: python scripts/problem_search.py <query>
+"""
+from __future__ import annotations
+import argparse
+import csv
+import json
+import pickle
+import re
+import sqlite3
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+REGISTRY = ROOT / "tracks/registry.json"
+SNAPSHOT = ROOT / ".cache/search_index.pickle"
+SNAPSHOT_VERSION = 1
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse separators ('product-of_array' -> 'product of array')."""
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text.lower()).split())
+
+def trigrams(text: str) -> set[str]:
+    """Word-padded trigrams, so short prefixes ('pr' -> '  p', ' pr') still match."""
+    grams = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class SearchIndex:
+    """Ranked ID/title/slug lookup over a few thousand problems."""
+
+    def __init__(self, records: list[dict]):
+        self.records = records
+        self.by_id: dict[int, int] = {}
+        self.postings: dict[str, list[int]] = defaultdict(list)
+        self.keys: list[str] = []
+        for i, rec in enumerate(records):
+            self.by_id.setdefault(rec["id"], i)
+            key = normalize(f"{rec['title']} {rec['slug']}")
+            self.keys.append(key)
+            for gram in trigrams(key):
+                self.postings[gram].append(i)
+        self.postings = dict(self.postings)
+
+    def get(self, problem_id: int) -> dict | None:
+        """Exact lookup by problem ID."""
+        i = self.by_id.get(problem_id)
+        return self.records[i] if i is not None else None
+
+    def search(self, query: str, limit: int = 8) -> list[dict]:
+        """Return up to `limit` records ranked by ID prefix or trigram overlap."""
+        query = query.strip()
+        if not query:
+            return []
+
+        if query.isdigit():
+            exact = self.get(int(query))
+            prefixed = sorted(
+                (r for r in self.records if str(r["id"]).startswith(query) and r is not exact),
+                key=lambda r: r["id"],
+            )
+            return ([exact] if exact else []) + prefixed[:limit - bool(exact)]
+
+        grams = trigrams(query)
+        scores: dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for i in self.postings.get(gram, ()):
+                scores[i] += 1
+
+        needle = normalize(query)
+        def rank(i: int) -> tuple:
+            key = self.keys[i]
+            # Substring hits first (title prefix best), then trigram overlap, then ID
+            return (
+                not key.startswith(needle),
+                needle not in key,
+                -scores[i] / len(grams),
+                self.records[i]["id"],
+            )
+
+        # Require at least half of the query trigrams to keep typos in but noise out
+        threshold = max(1, len(grams) // 2)
+        candidates = [i for i, score in scores.items() if score >= threshold]
+        return [self.records[i] for i in sorted(candidates, key=rank)[:limit]]
+
+def track_csvs() -> list[Path]:
+    """Paths of all track CSVs listed in the registry."""
+    try:
+        registry = json.loads(REGISTRY.read_text(encoding="utf-8"))
+        return [ROOT / t["csv"] for t in registry["tracks"] if t.get("csv")]
+    except (OSError, json.JSONDecodeError, KeyError):
+        return sorted((ROOT / "tracks").glob("*.csv"))
+
+def catalog_db() -> Path:
+    """Location of the local catalog built by scripts/catalog.py."""
+    from catalog import CATALOG_DB
+    return CATALOG_DB
+
+def source_paths() -> list[Path]:
+    return track_csvs() + [catalog_db()]
+
+def signature(paths: list[Path]) -> tuple:
+    """Cheap change detector for the snapshot: (path, mtime, size) of each source."""
+    sig = []
+    for path in paths:
+        try:
+            st = path.stat()
+            sig.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append((str(path), 0, 0))
+    return tuple(sig)
+
+def load_records() -> list[dict]:
+    """Collect problem records; track CSVs win over catalog rows for the same ID."""
+    records: dict[int, dict] = {}
+
+    db = catalog_db()
+    if db.exists():
+        try:
+            conn = sqlite3.connect(db)
+            rows = conn.execute(
+                "SELECT frontend_id, title, slug, difficulty, tags FROM problems"
+            ).fetchall()
+            conn.close()
+        except sqlite3.Error:
+            rows = []
+        for fid, title, slug, difficulty, tags in rows:
+            if str(fid).isdigit():
+                records[int(fid)] = {
+                    "id": int(fid), "title": title, "slug": slug,
+                    "difficulty": difficulty, "tags": tags,
+                }
+
+    for path in track_csvs():
+        try:
+            with path.open("r", encoding="utf-8", newline="") as f:
+                for row in csv.DictReader(f):
+                    if not (row.get("id") or "").strip().isdigit():
+                        continue
+                    pid = int(row["id"])
+                    records[pid] = {
+                        "id": pid,
+                        "title": (row.get("title") or "").strip(),
+                        "slug": (row.get("slug") or "").strip(),
+                        "difficulty": (row.get("difficulty") or "").strip(),
+                        "tags": (row.get("tags") or "").strip(),
+                    }
+        except OSError:
+            continue
+
+    return [records[k] for k in sorted(records)]
+
+def load_index(rebuild: bool = False) -> SearchIndex:
+    """Load the on-disk snapshot, rebuilding it if any source changed."""
+    sig = signature(source_paths())
+    if not rebuild and SNAPSHOT.exists():
+        try:
+            with SNAPSHOT.open("rb") as f:
+                version, snap_sig, state = pickle.load(f)
+            if version == SNAPSHOT_VERSION and snap_sig == sig:
+                index = SearchIndex.__new__(SearchIndex)
+                index.__dict__.update(state)
+                return index
+        except Exception:
+            pass
+
+    index = SearchIndex(load_records())
+    try:
+        SNAPSHOT.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SNAPSHOT.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            # Plain containers only, so the snapshot loads regardless of __main__
+            pickle.dump((SNAPSHOT_VERSION, sig, vars(index)), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(SNAPSHOT)
+    except OSError:
+        pass
+    return index
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description="Search problems by ID, title or slug")
+    p.add_argument("query", nargs="+")
+    args = p.parse_args()
+    t0 = time.perf_counter()
+    idx = load_index()
+    t1 = time.perf_counter()
+    hits = idx.search(" ".join(args.query))
+    t2 = time.perf_counter()
+    for rec in hits:
+        print(f"{rec['id']:04d}  {rec['title']} ({rec['slug']}) [{rec['difficulty']}]")
+    print(f"\n{len(idx.records)} problems | load {1000*(t1-t0):.1f} ms | search {1000*(t2-t1):.2f} ms")
@@ -0,0 +1,80 @@
+"""
+Append-only progress history, one JSON line per change:
+docs/data/progress/<track>.jsonl
+
+Sync appends a snapshot whenever a track's counts change; readers that only
+need the current numbers read the last line (tail seek, no re-scan), and the
+dashboard plots the whole file as progress over time.
+"""
+from __future__ import annotations
+import datetime
+import json
+import os
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PROGRESS_DIR = ROOT / "docs/data/progress"
+TAIL_BLOCK = 4096
+
+def log_path(track_key: str) -> Path:
+    return PROGRESS_DIR / f"{track_key}.jsonl"
+
+def snapshot(items: list[dict], solved_ids: set[int]) -> dict:
+    """Solved/total counts for a track plus solved counts by difficulty and category."""
+    solved = [item for item in items if item["id"] in solved_ids]
+    by_difficulty, by_category = {}, {}
+    for item in solved:
+        difficulty = item.get("difficulty") or "Unknown"
+        by_difficulty[difficulty] = by_difficulty.get(difficulty, 0) + 1
+        category = item.get("category") or "Uncategorized"
+        by_category[category] = by_category.get(category, 0) + 1
+    return {
+        "solved": len(solved),
+        "total": len(items),
+        "difficulty": dict(sorted(by_difficulty.items())),
+        "category": dict(sorted(by_category.items())),
+    }
+
+def read_tail(path: Path) -> dict | None:
+    """Last record of a log, reading backwards from EOF in fixed-size blocks."""
+    try:
+        with path.open("rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            buf = b""
+            pos = end
+            while pos > 0:
+                step = min(TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+                lines = buf.rstrip(b"\n").rsplit(b"\n", 1)
+                if len(lines) == 2 or pos == 0:
+                    last = lines[-1].strip()
+                    return json.loads(last) if last else None
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return None
+
+def latest(track_key: str) -> dict | None:
+    return read_tail(log_path(track_key))
+
+def append_if_changed(track_key: str, record: dict) -> bool:
+    """Append `record` (timestamped) unless it matches the last entry. Call under the track lock."""
+    path = log_path(track_key)
+    last = read_tail(path)
+    if last is not None and {k: v for k, v in last.items() if k != "ts"} == record:
+        return False
+
+    entry = {"ts": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"), **record}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    return True
+
+def history(track_key: str) -> list[dict]:
+    """Every record for a track, oldest first."""
+    try:
+        with log_path(track_key).open(encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
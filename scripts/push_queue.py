@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Background `git push` with retries; status is reported on the next wizard run.
+Usage:
+  python scripts/push_queue.py          # show last push status
+  python scripts/push_queue.py --worker # push now (what daily.py spawns)
+"""
+from __future__ import annotations
+import os
+import sys
+import json
+import argparse
+import time
+import datetime
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+STATUS = ROOT / ".cache/push_status.json"
+MAX_ATTEMPTS = 4
+BACKOFF_SECONDS = 5
+
+def now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+
+def read_status() -> dict:
+    try:
+        return json.loads(STATUS.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def write_status(status: dict) -> None:
+    STATUS.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATUS.with_suffix(".tmp")
+    tmp.write_text(json.dumps(status, indent=2), encoding="utf-8")
+    tmp.replace(STATUS)
+
+def pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except (OSError, TypeError):
+        return False
+    return True
+
+def commits_ahead() -> int:
+    """Commits on HEAD not yet on its upstream (0 if unknown)."""
+    result = subprocess.run(
+        ["git", "rev-list", "--count", "@{u}..HEAD"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    return int(result.stdout.strip() or 0) if result.returncode == 0 else 0
+
+def enqueue() -> bool:
+    """Start a detached push worker unless one is already running. Returns True if queued."""
+    status = read_status()
+    if status.get("state") == "running" and pid_alive(status.get("pid")):
+        # The running worker re-checks for unpushed commits before exiting
+        return True
+    # Written before the worker starts: from here on only the worker updates the status,
+    # so a fast push's final result is never overwritten by this process
+    write_status({"state": "queued", "queued_at": now(), "reported": False})
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--worker"],
+            cwd=ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        write_status(status)
+        return False
+    return True
+
+def worker() -> int:
+    """Push with retries until HEAD is on the upstream or attempts run out."""
+    status = {"state": "running", "pid": os.getpid(), "queued_at": read_status().get("queued_at"),
+              "started_at": now(), "reported": False}
+    write_status(status)
+
+    attempts, error = 0, ""
+    while attempts < MAX_ATTEMPTS:
+        attempts += 1
+        result = subprocess.run(["git", "push"], cwd=ROOT, capture_output=True, text=True)
+        if result.returncode == 0:
+            error = ""
+            # Commits made while we were pushing go out in the same run
+            if commits_ahead() == 0:
+                break
+            continue
+        error = (result.stderr or result.stdout).strip()[-500:]
+        time.sleep(BACKOFF_SECONDS * attempts)
+
+    status.update({
+        "state": "failed" if error else "ok",
+        "attempts": attempts,
+        "finished_at": now(),
+        "error": error,
+    })
+    write_status(status)
+    return 1 if error else 0
+
+def pending_report() -> str | None:
+    """One-line summary of an unreported finished push (marks it reported)."""
+    status = read_status()
+    if not status or status.get("reported") or status.get("state") in ("queued", "running"):
+        return None
+    status["reported"] = True
+    write_status(status)
+    if status["state"] == "ok":
+        return f"✓ Background push succeeded ({status.get('finished_at')})"
+    return f"✗ Background push failed after {status.get('attempts')} attempts: {status.get('error')}"
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description="Show the last background push status")
+    p.add_argument("--worker", action="store_true", help="Push now (what daily.py spawns)")
+    args = p.parse_args()
+    if args.worker:
+        raise SystemExit(worker())
+    status = read_status()
+    print(json.dumps(status, indent=2) if status else "No push recorded.")
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Run the test cases of every solution under python/*/ in sandboxed workers
+(CPU, memory and open-file limits plus a wall-clock kill; see sandbox.py).
+Cases live in a sidecar next to the solution, e.g. 0605_can-place-flowers.cases.json:
+  {"method": "canPlaceFlowers", "cases": [{"args": [[1,0,0,0,1], 1], "expected": true}]}
+"method" may be omitted when Solution has a single public method; "structures"
+and "returns" convert linked-list/tree/graph arguments and results (see structures.py).
+A case may give LeetCode's example text instead of "args": {"input": "root = [1,null,2]", "expected": 2}.
+Alternative implementations are methods named <method>__<variant> (see bench.py).
+Usage: python scripts/run_tests.py [paths...] [--timeout 2] [--workers N] [--memory-mb 1024] [--json] [--out FILE]
+"""
+from __future__ import annotations
+import argparse
+import copy
+import importlib.util
+import json
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+import sandbox
+import structures
+
+ROOT = Path(__file__).resolve().parents[1]
+PYTHON_DIR = ROOT / "python"
+DEFAULT_TIMEOUT = 2.0
+# Wall-clock allowance per file on top of its cases' timeouts (imports, worker start)
+FILE_SLACK = 5.0
+
+class CaseTimeout(Exception):
+    pass
+
+def cases_path(solution: Path) -> Path:
+    return solution.with_name(f"{solution.stem}.cases.json")
+
+def display_path(path: Path) -> str:
+    try:
+        return str(path.relative_to(ROOT))
+    except ValueError:
+        return str(path)
+
+def discover(paths: list[Path] | None = None) -> list[Path]:
+    """Solution files under the given files/dirs (default: python/*/)."""
+    found = []
+    for base in paths or [PYTHON_DIR]:
+        base = Path(base).resolve()
+        candidates = [base] if base.is_file() else sorted(base.rglob("*.py"))
+        found += [p for p in candidates if p.suffix == ".py" and p.name[:4].isdigit()]
+    return found
+
+def solution_globals(path: Path) -> dict:
+    """Node classes injected into a solution module before it runs (see structures.injected)."""
+    return structures.injected(load_cases(path) if cases_path(path).exists() else {})
+
+def load_module(path: Path, name: str | None = None):
+    """Import a solution file by path (its filename need not be a valid module name)."""
+    name = name or f"solution_{path.stem.replace('-', '_')}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    module.__dict__.update(solution_globals(path))
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def load_cases(solution: Path) -> dict:
+    return json.loads(cases_path(solution).read_text(encoding="utf-8"))
+
+# Alternative implementations are declared as <method>__<variant>
+VARIANT_SEP = "__"
+
+def resolve_method(cls, name: str | None) -> str:
+    """The sidecar's method, or Solution's only public (non-variant) method."""
+    if name:
+        return name
+    public = [n for n, v in vars(cls).items()
+              if callable(v) and not n.startswith("_") and VARIANT_SEP not in n]
+    if len(public) != 1:
+        raise ValueError(f"set \"method\" in the sidecar (Solution has {len(public)} public methods)")
+    return public[0]
+
+def method_variants(cls, method: str) -> dict[str, str]:
+    """label -> attribute name for a method and its variants ("main" is the method itself)."""
+    variants = {"main": method}
+    prefix = method + VARIANT_SEP
+    for name in vars(cls):
+        if name.startswith(prefix) and callable(getattr(cls, name)):
+            variants[name[len(prefix):]] = name
+    return variants
+
+def normalize(value):
+    """Compare results the way they'd be written in JSON (tuples == lists, nodes == their lists)."""
+    value = structures.to_plain(value)
+    try:
+        return json.loads(json.dumps(value))
+    except (TypeError, ValueError):
+        return value
+
+def case_args(case: dict) -> list:
+    """A case's JSON arguments, parsed from its "input" text when it has no "args"."""
+    return case["args"] if "args" in case else structures.parse_args(case["input"])
+
+def _on_alarm(signum, frame):
+    raise CaseTimeout()
+
+def run_case(solution_cls, method: str, case: dict, timeout: float,
+             kinds: list | None = None, returns: str | None = None) -> dict:
+    """Run one case on a fresh Solution with a SIGALRM timeout (where available)."""
+    result = {"args": case_args(case), "expected": case.get("expected")}
+    # The solution gets its own copy, so the report shows the sidecar's inputs even if it mutates them
+    args = structures.build_args(copy.deepcopy(result["args"]), kinds)
+    use_alarm = hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    start = time.perf_counter()
+    try:
+        got = getattr(solution_cls(), method)(*args)
+        result["ms"] = round((time.perf_counter() - start) * 1000, 3)
+        result["got"] = normalize(structures.to_plain(got, returns))
+        result["status"] = "pass" if result["got"] == case.get("expected") else "fail"
+    except CaseTimeout:
+        result.update(status="timeout", ms=round(timeout * 1000, 3))
+    except Exception as e:
+        result.update(status="error", error=f"{type(e).__name__}: {e}",
+                      ms=round((time.perf_counter() - start) * 1000, 3))
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return result
+
+def run_file(path: str, timeout: float) -> dict:
+    """Import one solution and run all its cases (executes in a pool worker)."""
+    solution = Path(path)
+    report = {"file": display_path(solution), "cases": []}
+    try:
+        spec = load_cases(solution)
+        module = load_module(solution)
+        method = resolve_method(module.Solution, spec.get("method"))
+    except Exception as e:
+        report.update(status="error", error=f"{type(e).__name__}: {e}")
+        return report
+
+    report["method"] = method
+    kinds, returns = spec.get("structures"), spec.get("returns")
+    report["cases"] = [run_case(module.Solution, method, case, timeout, kinds, returns)
+                       for case in spec.get("cases", [])]
+    report["status"] = "pass" if all(c["status"] == "pass" for c in report["cases"]) else "fail"
+    return report
+
+def case_count(solution: Path) -> int:
+    try:
+        return len(load_cases(solution).get("cases", []))
+    except (OSError, ValueError):
+        return 0
+
+def run_all(solutions: list[Path], timeout: float = DEFAULT_TIMEOUT, workers: int | None = None,
+            memory_mb: int = sandbox.DEFAULT_MEMORY_MB) -> dict:
+    """Run every solution that has a sidecar; return the machine-readable report."""
+    with_cases = [s for s in solutions if cases_path(s).exists()]
+    start = time.perf_counter()
+    # SIGALRM stops a slow case; the wall-clock kill catches what it can't (C loops, blocked signals)
+    wall = timeout * max([case_count(s) for s in with_cases] + [1]) + FILE_SLACK
+    workers = min(workers or os.cpu_count() or 1, max(len(with_cases), 1))
+    with sandbox.Sandbox(workers, wall=wall, memory_mb=memory_mb) as box:
+        outcomes = box.map(run_file, [(str(s), timeout) for s in with_cases])
+    files = [
+        o["value"] if o["status"] == "ok"
+        else {"file": display_path(s), "cases": [], "status": "error", "error": o["error"]}
+        for s, o in zip(with_cases, outcomes)
+    ]
+
+    cases = [c for f in files for c in f["cases"]]
+    return {
+        "summary": {
+            "files": len(files),
+            "without_cases": [display_path(s) for s in solutions if s not in with_cases],
+            "cases": len(cases),
+            **{status: sum(c["status"] == status for c in cases) for status in ("pass", "fail", "error", "timeout")},
+            "file_errors": sum(f["status"] == "error" for f in files),
+            "seconds": round(time.perf_counter() - start, 3),
+        },
+        "results": files,
+    }
+
+def print_report(report: dict) -> None:
+    for f in report["results"]:
+        if f["status"] == "error":
+            print(f"💥 {f['file']}: {f['error']}")
+            continue
+        passed = sum(c["status"] == "pass" for c in f["cases"])
+        total_ms = sum(c["ms"] for c in f["cases"])
+        mark = "✅" if f["status"] == "pass" else "❌"
+        print(f"{mark} {f['file']}  {passed}/{len(f['cases'])}  ({total_ms:.2f} ms)")
+        for i, c in enumerate(f["cases"]):
+            if c["status"] != "pass":
+                if c["status"] == "timeout":
+                    detail = f"timed out after {c['ms']:.0f} ms"
+                else:
+                    detail = c.get("error") or f"expected {c['expected']!r}, got {c.get('got')!r}"
+                print(f"     case {i} {c['status']}: args={c['args']!r} {detail}")
+
+    s = report["summary"]
+    print(f"\n{s['pass']}/{s['cases']} cases passed in {s['files']} files ({s['seconds']:.2f}s)"
+          + (f", {len(s['without_cases'])} files without cases" if s["without_cases"] else ""))
+
+def main():
+    p = argparse.ArgumentParser(description="Run solution test cases in parallel")
+    p.add_argument("paths", nargs="*", type=Path, help="Solution files or directories (default: python/)")
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-case timeout in seconds")
+    p.add_argument("--workers", type=int, help="Pool size (default: CPU count)")
+    p.add_argument("--memory-mb", type=int, default=sandbox.DEFAULT_MEMORY_MB,
+                   help="Address space each worker may add, in MB")
+    p.add_argument("--json", action="store_true", help="Print the JSON report instead of a summary")
+    p.add_argument("--out", type=Path, help="Also write the JSON report to this file")
+    args = p.parse_args()
+
+    report = run_all(discover(args.paths), args.timeout, args.workers, args.memory_mb)
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    s = report["summary"]
+    raise SystemExit(1 if s["fail"] or s["error"] or s["timeout"] or s["file_errors"] else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Resource-limited worker processes for running untrusted solution code.
+
+Each worker caps itself with setrlimit (CPU seconds per task, address space
+it may add on top of its own, open files) and is reused task after task;
+the parent holds a wall-clock deadline per task and kills a worker that
+overruns it (a C-level loop, a blocked signal), then starts a fresh one in
+its place. Runaway tasks come back as an outcome, never as an exception:
+  {"status": "ok" | "error" | "timeout" | "cpu" | "memory" | "crashed",
+   "value": ..., "error": str | None, "seconds": float}
+On platforms without `resource`, only the wall-clock kill applies.
+"""
+from __future__ import annotations
+import math
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import wait
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_WALL = 10.0
+DEFAULT_MEMORY_MB = 1024
+DEFAULT_OPEN_FILES = 64
+
+class CpuLimitExceeded(Exception):
+    pass
+
+def _on_xcpu(signum, frame):
+    raise CpuLimitExceeded
+
+def _address_space() -> int:
+    """Current virtual size of this process in bytes (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+def _cpu_used() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def _apply_limits(memory_mb: int, open_files: int) -> None:
+    if resource is None:
+        return
+    memory = _address_space() + memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (memory if hard == resource.RLIM_INFINITY else min(memory, hard), hard))
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (open_files if hard == resource.RLIM_INFINITY else min(open_files, hard), hard))
+    signal.signal(signal.SIGXCPU, _on_xcpu)
+
+def _worker(conn, cpu_seconds: float, memory_mb: int, open_files: int) -> None:
+    """Worker loop: receive (fn, args), run it under the limits, send back an outcome."""
+    _apply_limits(memory_mb, open_files)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        fn, args = task
+        if resource is not None:
+            # RLIMIT_CPU counts the whole process lifetime, so move the soft limit per task
+            _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+            soft = math.ceil(_cpu_used() + cpu_seconds)
+            resource.setrlimit(resource.RLIMIT_CPU, (soft if hard == resource.RLIM_INFINITY else min(soft, hard), hard))
+        start = time.perf_counter()
+        try:
+            outcome = {"status": "ok", "value": fn(*args), "error": None}
+        except CpuLimitExceeded:
+            outcome = {"status": "cpu", "value": None, "error": f"CPU limit ({cpu_seconds:g}s) exceeded"}
+        except MemoryError:
+            outcome = {"status": "memory", "value": None, "error": f"memory limit ({memory_mb} MB) exceeded"}
+        except Exception as e:
+            outcome = {"status": "error", "value": None, "error": f"{type(e).__name__}: {e}"}
+        outcome["seconds"] = time.perf_counter() - start
+        try:
+            conn.send(outcome)
+        except Exception as e:  # unpicklable return value
+            conn.send({"status": "error", "value": None, "error": f"{type(e).__name__}: {e}",
+                       "seconds": outcome["seconds"]})
+
+class Sandbox:
+    """A pool of limited, reusable workers; `imap_unordered` yields (index, outcome) pairs."""
+
+    def __init__(self, workers: int | None = None, wall: float = DEFAULT_WALL, cpu: float | None = None,
+                 memory_mb: int = DEFAULT_MEMORY_MB, open_files: int = DEFAULT_OPEN_FILES):
+        self.size = max(1, workers or os.cpu_count() or 1)
+        self.wall = wall
+        self.limits = (cpu if cpu is not None else wall, memory_mb, open_files)
+        self.started = 0
+        self._idle: list[tuple] = []
+
+    def _spawn(self) -> tuple:
+        parent, child = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_worker, args=(child, *self.limits), daemon=True)
+        process.start()
+        child.close()
+        self.started += 1
+        return process, parent
+
+    def _kill(self, worker: tuple) -> None:
+        process, conn = worker
+        process.kill()
+        process.join()
+        conn.close()
+
+    def imap_unordered(self, fn, arg_tuples, wall: float | None = None):
+        """Run fn(*args) for each args tuple; abandoning the generator kills unfinished tasks."""
+        wall = wall or self.wall
+        pending = list(enumerate(arg_tuples))[::-1]
+        busy: dict = {}  # conn -> (worker, index, deadline)
+        try:
+            while pending or busy:
+                while pending and len(busy) < self.size:
+                    worker = self._idle.pop() if self._idle else self._spawn()
+                    index, args = pending.pop()
+                    worker[1].send((fn, tuple(args)))
+                    busy[worker[1]] = (worker, index, time.monotonic() + wall)
+
+                timeout = max(0.0, min(deadline for _, _, deadline in busy.values()) - time.monotonic())
+                for conn in wait(list(busy), timeout):
+                    worker, index, _ = busy.pop(conn)
+                    try:
+                        outcome = conn.recv()
+                        self._idle.append(worker)
+                    except (EOFError, OSError):
+                        worker[0].join(timeout=1)
+                        code = worker[0].exitcode
+                        self._kill(worker)
+                        outcome = {"status": "crashed", "value": None, "seconds": 0.0,
+                                   "error": f"worker died (exit code {code})"}
+                    yield index, outcome
+
+                now = time.monotonic()
+                for conn, (worker, index, deadline) in list(busy.items()):
+                    if now >= deadline:
+                        del busy[conn]
+                        self._kill(worker)
+                        yield index, {"status": "timeout", "value": None, "seconds": wall,
+                                      "error": f"killed after {wall:g}s wall clock"}
+        finally:
+            for worker, _, _ in busy.values():
+                self._kill(worker)
+
+    def map(self, fn, arg_tuples, wall: float | None = None) -> list[dict]:
+        """Outcomes in input order."""
+        outcomes = dict(self.imap_unordered(fn, arg_tuples, wall))
+        return [outcomes[i] for i in range(len(outcomes))]
+
+    def close(self) -> None:
+        for process, conn in self._idle:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            process.join(timeout=1)
+            if process.is_alive():
+                process.kill()
+            conn.close()
+        self._idle.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,90 @@
+"""
+Large benchmark inputs published once into shared memory, so pool workers
+attach by name instead of unpickling a multi-megabyte copy for every task.
+
+Int lists are packed as int64 and strings as UTF-8 in one segment per
+argument list; anything else (a small k, nested lists) travels inside the
+handle. A worker decodes a segment straight from the mapped buffer the first
+time it sees it and keeps the result, so it holds one copy no matter how many
+timing tasks it runs. Callers that let a solution mutate its input must copy
+per call themselves (see the "mutates" sidecar flag).
+"""
+from __future__ import annotations
+import array
+from multiprocessing import shared_memory
+
+# Decoded argument lists kept per worker; old ones are dropped as files move on
+ATTACHED_LIMIT = 4
+_attached: dict[str, list] = {}
+
+class SharedInputs:
+    """Owner side: publish argument lists and unlink every segment on exit."""
+
+    def __init__(self):
+        self._segments: list[shared_memory.SharedMemory] = []
+
+    def publish(self, args: list) -> dict:
+        """Copy `args` into a new segment; returns the picklable handle workers attach with."""
+        parts, blobs, size = [], [], 0
+        for arg in args:
+            if isinstance(arg, str):
+                kind, blob = "str", arg.encode("utf-8")
+            elif isinstance(arg, list) and arg:
+                try:
+                    kind, blob = "ints", array.array("q", arg).tobytes()
+                except (TypeError, OverflowError):
+                    parts.append(("value", arg))
+                    continue
+            else:
+                parts.append(("value", arg))
+                continue
+            parts.append((kind, size, len(blob)))
+            blobs.append(blob)
+            size += len(blob)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._segments.append(shm)
+        offset = 0
+        for blob in blobs:
+            shm.buf[offset:offset + len(blob)] = blob
+            offset += len(blob)
+        return {"name": shm.name, "parts": parts}
+
+    def close(self) -> None:
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+        self._segments.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _decode(buf: memoryview, part: tuple):
+    kind = part[0]
+    if kind == "value":
+        return part[1]
+    _, offset, length = part
+    with buf[offset:offset + length] as view:
+        if kind == "str":
+            return str(view, "utf-8")
+        ints = array.array("q")
+        ints.frombytes(view)
+        return ints.tolist()
+
+def attach(handle: dict) -> list:
+    """The argument list behind `handle`, decoded once per process."""
+    name = handle["name"]
+    args = _attached.get(name)
+    if args is None:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            args = [_decode(shm.buf, part) for part in handle["parts"]]
+        finally:
+            shm.close()
+        _attached[name] = args
+        if len(_attached) > ATTACHED_LIMIT:
+            del _attached[next(iter(_attached))]
+    return args
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Stress-test solutions against brute-force oracles on random inputs.
+A solution opts in with a module-level `brute_force(*args)` (and optionally
+`is_valid_input(*args)` for input constraints) plus a sidecar section:
+  "stress": {"generator": "flowerbed", "kwargs": {}, "min_n": 0, "max_n": 10}
+Cases run in parallel chunks across sandboxed workers (see sandbox.py); a
+disagreement is shrunk to a minimal counterexample, and a chunk that hangs or
+exhausts its limits is reported with its seed.
+Usage: python scripts/stress.py [paths...] [--cases 10000] [--workers N] [--seed 0]
+"""
+from __future__ import annotations
+import argparse
+import copy
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import generators
+import sandbox
+from run_tests import cases_path, discover, display_path, load_cases, load_module, normalize, resolve_method
+
+CHUNK = 500
+CHUNK_WALL = 60.0
+
+@lru_cache(maxsize=None)
+def stress_setup(path: str) -> tuple:
+    """(solution method, brute force, validity check, stress spec) for a solution, cached per process."""
+    solution = Path(path)
+    spec = load_cases(solution)
+    module = load_module(solution)
+    method = getattr(module.Solution(), resolve_method(module.Solution, spec.get("method")))
+    valid = getattr(module, "is_valid_input", lambda *args: True)
+    return method, module.brute_force, valid, spec["stress"]
+
+def is_stressable(solution: Path) -> bool:
+    if not cases_path(solution).exists() or "stress" not in load_cases(solution):
+        return False
+    return "def brute_force" in solution.read_text(encoding="utf-8")
+
+def outcome(fn, args: list):
+    """Normalized result, or the exception as a string; args are copied so mutation can't leak."""
+    try:
+        return normalize(fn(*copy.deepcopy(args)))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+def disagreement(path: str, args: list) -> tuple | None:
+    """(expected, got) when the solution and the oracle differ on args."""
+    method, brute, _, _ = stress_setup(path)
+    expected = outcome(brute, args)
+    got = outcome(method, args)
+    return None if got == expected else (expected, got)
+
+def run_chunk(path: str, seed: int, count: int) -> dict:
+    """Run `count` random cases seeded by `seed` (executes in a pool worker)."""
+    _, _, valid, stress = stress_setup(path)
+    gen = generators.get(stress["generator"])
+    rng = generators.Rng(seed)
+    for i in range(count):
+        n = rng.random.randint(stress.get("min_n", 0), stress.get("max_n", 8))
+        args = gen(n, rng, **stress.get("kwargs", {}))
+        if valid(*args) and disagreement(path, args):
+            return {"ran": i + 1, "failure": args}
+    return {"ran": count, "failure": None}
+
+def shrink_candidates(value):
+    """Smaller versions of one argument, most aggressive first."""
+    if isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        for smaller in dict.fromkeys((0, value // 2, value - (1 if value > 0 else -1))):
+            if abs(smaller) < abs(value):
+                yield smaller
+    elif isinstance(value, (list, str)):
+        # Every cut size on short values, halving on long ones
+        n = len(value)
+        sizes = range(n - 1, 0, -1) if n <= 16 else [n >> k for k in range(1, n.bit_length())]
+        for size in sizes:
+            for i in range(0, n - size + 1, size):
+                yield value[:i] + value[i + size:]
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                for smaller in shrink_candidates(item):
+                    yield value[:i] + [smaller] + value[i + 1:]
+
+def shrink(path: str, args: list) -> list:
+    """Greedily replace arguments with smaller ones while the disagreement persists."""
+    _, _, valid, _ = stress_setup(path)
+
+    def still_fails(candidate):
+        return valid(*candidate) and disagreement(path, candidate) is not None
+
+    def candidates(args):
+        for i, arg in enumerate(args):
+            for smaller in shrink_candidates(arg):
+                yield args[:i] + [smaller] + args[i + 1:]
+        # A shorter list often only fails together with a smaller count (e.g. bed and n)
+        for i, arg in enumerate(args):
+            for smaller in shrink_candidates(arg):
+                for j, other in enumerate(args):
+                    if j != i and isinstance(other, int):
+                        for other_smaller in shrink_candidates(other):
+                            pair = list(args)
+                            pair[i], pair[j] = smaller, other_smaller
+                            yield pair
+
+    improved = True
+    while improved:
+        improved = False
+        for candidate in candidates(args):
+            if still_fails(candidate):
+                args, improved = candidate, True
+                break
+    return args
+
+def stress_file(solution: Path, cases: int, box: sandbox.Sandbox, seed: int) -> dict:
+    path = str(solution)
+    seeds = range(seed, seed + (cases + CHUNK - 1) // CHUNK)
+    counts = [min(CHUNK, cases - i * CHUNK) for i in range(len(seeds))]
+    ran, failure, error = 0, None, None
+    start = time.perf_counter()
+    # Leaving the loop early kills the chunks still running
+    for i, outcome in box.imap_unordered(run_chunk, [(path, s, count) for s, count in zip(seeds, counts)]):
+        if outcome["status"] != "ok":
+            error = f"chunk seed {seeds[i]}: {outcome['error']}"
+            break
+        ran += outcome["value"]["ran"]
+        failure = outcome["value"]["failure"]
+        if failure is not None:
+            break
+    elapsed = time.perf_counter() - start
+
+    report = {"file": display_path(solution), "cases": ran, "seconds": elapsed,
+              "cases_per_second": ran / elapsed if elapsed else 0.0, "failure": None, "error": error}
+    if failure is not None:
+        minimal = shrink(path, failure)
+        expected, got = disagreement(path, minimal)
+        report["failure"] = {"original": failure, "minimal": minimal, "expected": expected, "got": got}
+    return report
+
+def main():
+    p = argparse.ArgumentParser(description="Stress-test solutions against brute-force oracles")
+    p.add_argument("paths", nargs="*", type=Path, help="Solution files or directories (default: python/)")
+    p.add_argument("--cases", type=int, default=10_000, help="Random cases per solution")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    p.add_argument("--seed", type=int, default=0, help="First chunk seed (runs are reproducible)")
+    args = p.parse_args()
+
+    solutions = [s for s in discover(args.paths) if is_stressable(s)]
+    if not solutions:
+        print("No solutions define brute_force with a \"stress\" sidecar section.")
+        return
+
+    failed = False
+    with sandbox.Sandbox(args.workers, wall=CHUNK_WALL) as box:
+        reports = [stress_file(solution, args.cases, box, args.seed) for solution in solutions]
+    for report in reports:
+        rate = f"{report['cases']:,} cases, {report['cases_per_second']:,.0f}/s on {args.workers} workers"
+        if report["error"] is not None:
+            failed = True
+            print(f"💥 {report['file']}: {report['error']} (after {rate})")
+            continue
+        if report["failure"] is None:
+            print(f"✅ {report['file']}: {rate}")
+            continue
+        failed = True
+        f = report["failure"]
+        print(f"❌ {report['file']}: counterexample after {rate}")
+        print(f"     minimal args: {f['minimal']!r}")
+        print(f"     expected {f['expected']!r}, got {f['got']!r}")
+        print(f"     (original: {f['original']!r})")
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
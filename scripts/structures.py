@@ -0,0 +1,202 @@
+"""
+LeetCode's node classes plus builders and serializers for their bracketed
+input format, for tree, linked-list and graph problems.
+
+The runner injects ListNode and TreeNode into every solution module, so
+solutions can use them unimported, as on LeetCode. The graph Node is injected
+only when the sidecar names "graph": LeetCode reuses the name Node for other
+shapes (138's next/random, 116's left/right/next), which solutions define
+themselves. A sidecar converts
+JSON arguments with one kind per argument (null = leave as is):
+  {"method": "maxDepth", "structures": ["tree"], "cases": [{"args": [[3,9,20,null,null,15,7]], "expected": 3}]}
+Node results are serialized back to lists automatically; add "returns": "linked_list"
+(or "tree", "graph") so an empty (None) result compares as [].
+
+Builders and serializers are iterative, and the classes pickle and deepcopy
+through their list form, so 10^5+ node inputs never hit the recursion limit.
+A cyclic linked list keeps its cycle (LeetCode's `pos`), but structure shared
+between separate objects does not survive: two lists with a common tail come
+out of one deepcopy with two unshared tails.
+"""
+from __future__ import annotations
+import json
+import re
+from collections import deque
+from itertools import zip_longest
+
+class ListNode:
+    __slots__ = ("val", "next")
+
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+    def __repr__(self):
+        values, pos = list_cycle(self)
+        return f"ListNode({values}, pos={pos})" if pos >= 0 else f"ListNode({values})"
+
+    def __reduce__(self):
+        return build_list, list_cycle(self)
+
+class TreeNode:
+    __slots__ = ("val", "left", "right")
+
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f"TreeNode({tree_values(self)})"
+
+    def __reduce__(self):
+        return build_tree, (tree_values(self),)
+
+class Node:
+    """Graph node (Clone Graph): val plus a list of neighbor nodes."""
+    __slots__ = ("val", "neighbors")
+
+    def __init__(self, val=0, neighbors=None):
+        self.val = val
+        self.neighbors = neighbors if neighbors is not None else []
+
+    def __repr__(self):
+        return f"Node({self.val}, {len(self.neighbors)} neighbors)"
+
+    def __reduce__(self):
+        return _graph_node, (graph_adjacency(self), self.val)
+
+def injected(spec: dict) -> dict:
+    """Names to inject into a solution module, given its sidecar."""
+    names = {"ListNode": ListNode, "TreeNode": TreeNode}
+    if "graph" in [*(spec.get("structures") or []), spec.get("returns")]:
+        names["Node"] = Node
+    return names
+
+def build_list(values: list, pos: int = -1) -> ListNode | None:
+    """[1,2,3] -> 1 -> 2 -> 3; with pos >= 0 the tail links back to node `pos` (Linked List Cycle)."""
+    head = tail = None
+    for val in reversed(values):
+        head = ListNode(val, head)
+        tail = tail or head
+    if pos >= 0 and head is not None:
+        node = head
+        for _ in range(pos):
+            node = node.next
+        tail.next = node
+    return head
+
+def list_cycle(head: ListNode | None) -> tuple[list, int]:
+    """(values, pos): the distinct nodes' values and the index the tail links back to (-1 if none)."""
+    values, index = [], {}
+    while head is not None:
+        pos = index.get(id(head))
+        if pos is not None:
+            return values, pos
+        index[id(head)] = len(values)
+        values.append(head.val)
+        head = head.next
+    return values, -1
+
+def list_values(head: ListNode | None) -> list:
+    """Values from head to tail; raises ValueError on a cyclic list, which has no list form."""
+    values, pos = list_cycle(head)
+    if pos >= 0:
+        raise ValueError(f"linked list has a cycle (tail links back to index {pos})")
+    return values
+
+def build_tree(values: list) -> TreeNode | None:
+    """Level order with nulls for missing children, e.g. [1,null,2,3]."""
+    if not values or values[0] is None:
+        return None
+    root = TreeNode(values[0])
+    parents = deque([root])
+    i, n = 1, len(values)
+    while i < n:
+        parent = parents.popleft()
+        if values[i] is not None:
+            parent.left = TreeNode(values[i])
+            parents.append(parent.left)
+        i += 1
+        if i < n and values[i] is not None:
+            parent.right = TreeNode(values[i])
+            parents.append(parent.right)
+        i += 1
+    return root
+
+def tree_values(root: TreeNode | None) -> list:
+    """Inverse of build_tree: level order with trailing nulls dropped."""
+    values = []
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        if node is None:
+            values.append(None)
+            continue
+        values.append(node.val)
+        queue.append(node.left)
+        queue.append(node.right)
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+def _graph_node(adjacency: list[list[int]], start: int = 1) -> Node | None:
+    if not adjacency:
+        return None
+    nodes = [Node(i + 1) for i in range(len(adjacency))]
+    for node, neighbors in zip(nodes, adjacency):
+        node.neighbors = [nodes[j - 1] for j in neighbors]
+    return nodes[start - 1]
+
+def build_graph(adjacency: list[list[int]]) -> Node | None:
+    """1-indexed adjacency list, e.g. [[2,4],[1,3],[2,4],[1,3]] -> node 1."""
+    return _graph_node(adjacency)
+
+def graph_adjacency(node: Node | None) -> list[list[int]]:
+    """Inverse of build_graph for the component reachable from node (vals 1..n)."""
+    if node is None:
+        return []
+    seen = {node.val: node}
+    queue = deque([node])
+    while queue:
+        for neighbor in queue.popleft().neighbors:
+            if neighbor.val not in seen:
+                seen[neighbor.val] = neighbor
+                queue.append(neighbor)
+    # One row per value 1..max, so row i always describes node i+1 ([] for values not reached)
+    return [[n.val for n in seen[val].neighbors] if val in seen else [] for val in range(1, max(seen) + 1)]
+
+BUILDERS = {"linked_list": build_list, "tree": build_tree, "graph": build_graph}
+SERIALIZERS = {"linked_list": list_values, "tree": tree_values, "graph": graph_adjacency}
+
+def build_args(args: list, kinds: list | None) -> list:
+    """Sidecar args with each one built into the node structure its kind names."""
+    if not kinds:
+        return args
+    return [BUILDERS[kind](arg) if kind else arg for arg, kind in zip_longest(args, kinds[:len(args)])]
+
+def to_plain(value, kind: str | None = None):
+    """Node results as their LeetCode list form; anything else unchanged."""
+    if kind:
+        return SERIALIZERS[kind](value)
+    if isinstance(value, ListNode):
+        return list_values(value)
+    if isinstance(value, TreeNode):
+        return tree_values(value)
+    if isinstance(value, Node):
+        return graph_adjacency(value)
+    return value
+
+# A JSON string literal, or a `name =` prefix as in "root = [1,null,2], k = 3". Strings are
+# matched as whole tokens first, so an `x =` inside one is never mistaken for a prefix.
+_ARG_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|(^|[,\n])\s*[A-Za-z_]\w*\s*=(?!=)')
+
+def _strip_name(match: re.Match) -> str:
+    return match.group(0) if match.group(0).startswith('"') else match.group(1)
+
+def parse_args(text: str) -> list:
+    """Arguments from LeetCode's example text: `root = [1,null,2], k = 3`, or one JSON value per line.
+    The whole input is handed to json.loads in one call, so 10^5-element lists parse at C speed."""
+    body = _ARG_TOKEN.sub(_strip_name, text.strip())
+    values = (line.strip().rstrip(",") for line in body.splitlines())
+    return json.loads("[" + ",".join(v for v in values if v) + "]")
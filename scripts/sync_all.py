@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import csv, json, re, unicodedata, datetime
+from functools import lru_cache
 from pathlib import Path
 
+from locks import atomic_write_text, outputs_lock, track_lock
+import progress_log
+
 ROOT = Path(__file__).resolve().parents[1]
 REGISTRY = ROOT / "tracks/registry.json"
 README = ROOT / "README.md"
 INDEX_JSON = ROOT / "docs/data/index.json"
+# Canonical problem records shared by all tracks, plus per-track membership
+PROBLEMS_JSON = ROOT / "tracks/problems.json"
+# Measured complexity per solution path, written by scripts/complexity.py
+PERF_PROFILE = ROOT / "perf/profile.json"
 
 
 # Tag normalization mapping
@@ -153,9 +161,9 @@ def parse_csv(csv_path: Path) -> list[dict]:
     items.sort(key=lambda x: x["id"])
     return items
 
-def scan_solved_files(track: dict) -> set[int]:
-    """Scan directories for solved problem files."""
-    solved_ids = set()
+def scan_solved_files(track: dict) -> dict[int, list[str]]:
+    """Scan a track's directories for solution files, keyed by problem ID."""
+    solved = {}
     id_pattern = re.compile(r"(\d{4})_")
     
     for dir_key, ext in [("dir_py", "*.py"), ("dir_sql", "*.sql")]:
@@ -169,8 +177,52 @@ def scan_solved_files(track: dict) -> set[int]:
                 continue
             match = id_pattern.match(path.name)
             if match:
-                solved_ids.add(int(match.group(1)))
-    return solved_ids
+                rel = str(path.relative_to(ROOT)).replace("\\", "/")
+                solved.setdefault(int(match.group(1)), []).append(rel)
+    return solved
+
+def scan_all_solutions(tracks: list[dict]) -> dict[int, list[str]]:
+    """Solutions keyed by problem ID across every track, so one file counts everywhere."""
+    solutions = {}
+    for track in tracks:
+        for pid, paths in scan_solved_files(track).items():
+            solutions.setdefault(pid, []).extend(paths)
+    return {pid: sorted(set(paths)) for pid, paths in solutions.items()}
+
+def merge_problem(problems: dict, item: dict) -> None:
+    """Fold a track CSV item into its canonical problem record."""
+    record = problems.setdefault(str(item["id"]), {
+        "id": item["id"], "title": item["title"], "slug": item["slug"],
+        "difficulty": item["difficulty"], "tags": [], "link": item["link"],
+    })
+    record["tags"] = list(dict.fromkeys(record["tags"] + item["tags"]))
+    record["difficulty"] = record["difficulty"] or item["difficulty"]
+
+def build_problem_catalog(items_by_track: dict[str, list[dict]], solutions: dict[int, list[str]]) -> dict:
+    """Normalize track items into one record per problem plus track membership lists."""
+    problems, membership = {}, {}
+    for track_key, items in items_by_track.items():
+        membership[track_key] = [{"id": item["id"], "category": item["category"]} for item in items]
+        for item in items:
+            merge_problem(problems, item)
+    return {
+        "problems": dict(sorted(problems.items(), key=lambda kv: int(kv[0]))),
+        "tracks": membership,
+        "solutions": catalog_solutions(problems, solutions),
+    }
+
+def catalog_solutions(problems: dict, solutions: dict[int, list[str]]) -> dict[str, list[str]]:
+    """Solution paths for catalogued problems, keyed like the problem records."""
+    return {str(pid): paths for pid, paths in sorted(solutions.items()) if str(pid) in problems}
+
+def load_problem_catalog() -> dict:
+    try:
+        return json.loads(PROBLEMS_JSON.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"problems": {}, "tracks": {}, "solutions": {}}
+
+def write_problem_catalog(catalog: dict) -> None:
+    atomic_write_text(PROBLEMS_JSON, json.dumps(catalog, indent=2))
 
 def generate_checklist_markdown(track: dict, items: list[dict], solved_ids: set[int]) -> str:
     """Generate markdown checklist grouped by category."""
@@ -187,25 +239,25 @@ def generate_checklist_markdown(track: dict, items: list[dict], solved_ids: set[
             md_lines.append(f"- [{mark}] {item['id']:04d} — {item['slug']}")
     return "\n".join(md_lines) + "\n"
 
-def write_plan_and_checklist(track: dict, items: list[dict]) -> None:
+def write_plan_and_checklist(track: dict, items: list[dict], solved_ids: set[int]) -> None:
     """Write plan JSON and checklist markdown for a track."""
     try:
-        # Write plan JSON
+        # Write plan JSON (problem records live in tracks/problems.json)
         plan_json = ROOT / track["plan_json"]
-        plan_data = {"plan": track["key"], "items": items}
-        plan_json.write_text(json.dumps(plan_data, indent=2), encoding="utf-8")
-        
-        # Scan for solved files
-        solved_ids = scan_solved_files(track)
+        plan_data = {"plan": track["key"], "catalog": str(PROBLEMS_JSON.relative_to(ROOT)), "ids": [item["id"] for item in items]}
+        atomic_write_text(plan_json, json.dumps(plan_data, indent=2))
         
         # Generate and write checklist
         checklist_md = generate_checklist_markdown(track, items, solved_ids)
         checklist_path = ROOT / track["checklist_md"]
-        checklist_path.write_text(checklist_md, encoding="utf-8")
+        atomic_write_text(checklist_path, checklist_md)
         
-        # Update track statistics
-        track["solved"] = len([item for item in items if item["id"] in solved_ids])
+        # Update track statistics (cross-track: a solution in any track counts)
+        track["solved"] = len({item["id"] for item in items} & solved_ids)
         track["total_eff"] = len(items) or track.get("total", 0)
+
+        # History for the dashboard; callers hold this track's lock
+        progress_log.append_if_changed(track["key"], progress_log.snapshot(items, solved_ids))
         
     except (IOError, KeyError) as e:
         print(f"Error writing plan/checklist for {track.get('key', 'unknown')}: {e}")
@@ -233,7 +285,7 @@ def update_readme_progress(tracks: list[dict]):
             else:
                 txt += f"\n<!-- PROGRESS:{key}:start -->{name}: {track['solved']}/{track['total_eff']} ({pct}%)<!-- PROGRESS:{key}:end -->\n"
         
-        README.write_text(txt, encoding="utf-8")
+        atomic_write_text(README, txt)
     except (FileNotFoundError, PermissionError) as e:
         print(f"Error updating README: {e}")
         raise SystemExit(1)
@@ -298,25 +350,78 @@ def parse_header_sql(txt: str) -> dict:
         "link": extract_header_field(block, "Link")
     }
 
-def load_plans_all() -> dict[tuple[str, int], dict]:
+def load_plans_all(catalog: dict | None = None) -> dict[tuple[str, int], dict]:
     """Load all plan metadata indexed by (track, id)."""
     plans = {}
-    tracks_dir = ROOT / "tracks"
-    if not tracks_dir.exists():
-        return plans
-        
-    for path in tracks_dir.glob("*.json"):
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            track_key = path.stem
-            for item in data.get("items", []):
-                if "id" in item:
-                    plans[(track_key, int(item["id"]))] = item
-        except (json.JSONDecodeError, ValueError, IOError) as e:
-            print(f"Warning: Failed to load plan {path}: {e}")
-            continue
+    catalog = catalog if catalog is not None else load_problem_catalog()
+    problems = catalog.get("problems", {})
+    memberships = {}
+    for track_key, members in catalog.get("tracks", {}).items():
+        for member in members:
+            memberships.setdefault(member["id"], []).append(track_key)
+
+    for track_key, members in catalog.get("tracks", {}).items():
+        for member in members:
+            record = problems.get(str(member["id"]))
+            if record:
+                plans[(track_key, member["id"])] = {
+                    **record, "category": member["category"], "tracks": memberships[member["id"]],
+                }
     return plans
 
+@lru_cache(maxsize=1)
+def _load_perf_profile(stamp: int | None) -> dict:
+    if stamp is None:
+        return {}
+    try:
+        return json.loads(PERF_PROFILE.read_text(encoding="utf-8")).get("solutions", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def perf_summary(rel_path: str) -> dict | None:
+    """Fitted time/space classes and peak memory for one solution from perf/profile.json (re-read only when it changes)."""
+    try:
+        stamp = PERF_PROFILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        stamp = None
+    entry = _load_perf_profile(stamp).get(rel_path)
+    if not entry:
+        return None
+    summary = {}
+    if "time" in entry:
+        summary.update(time=entry["time"].get("fit"), time_status=entry["time"].get("status"))
+    if "memory" in entry:
+        memory = entry["memory"]
+        summary.update(space=memory.get("fit"), space_status=memory.get("status"),
+                       peak_bytes=memory["peak_bytes"][-1], peak_n=memory["sizes"][-1])
+    return summary or None
+
+def build_index_item(track: dict, path: Path, plan_meta: dict, file_type: str) -> dict | None:
+    """Parse one solution file into an index item (None if it has no header ID)."""
+    parser = parse_header_py if file_type == "py" else parse_header_sql
+    header = parser(path.read_text(encoding="utf-8"))
+    if not header["id"]:
+        return None
+
+    meta = plan_meta.get((track["key"], header["id"]), {})
+    tags = list(dict.fromkeys((header["tags"] or []) + (meta.get("tags") or [])))
+    category = meta.get("category") or auto_category(tags, "SQL" if file_type == "sql" else "Uncategorized")
+
+    rel_path = str(path.relative_to(ROOT)).replace("\\", "/")
+    item = {
+        "id": header["id"], "title": header["title"], "slug": header["slug"],
+        "idea": header["idea"], "time": header["time"], "space": header["space"],
+        "tags": tags, "link": header["link"] or meta.get("link"),
+        "difficulty": meta.get("difficulty", ""), "category": category,
+        "track": track["key"], "type": file_type,
+        "tracks": meta.get("tracks") or [track["key"]],
+        "path": rel_path
+    }
+    perf = perf_summary(rel_path)
+    if perf:
+        item["perf"] = perf
+    return item
+
 def process_track_files(track: dict, plan_meta: dict, file_type: str) -> list[dict]:
     """Process files for a specific track and type."""
     items = []
@@ -328,87 +433,164 @@ def process_track_files(track: dict, plan_meta: dict, file_type: str) -> list[di
     if not base.exists():
         return items
         
-    parser = parse_header_py if file_type == "py" else parse_header_sql
     extension = f"*.{file_type}" if file_type != "py" else "*.py"
     
     for path in base.glob(extension):
         if path.name.startswith("_"):
             continue
         try:
-            header = parser(path.read_text(encoding="utf-8"))
-            if not header["id"]:
-                continue
-                
-            meta = plan_meta.get((track["key"], header["id"]), {})
-            tags = list(dict.fromkeys((header["tags"] or []) + (meta.get("tags") or [])))
-            category = meta.get("category") or auto_category(tags, "SQL" if file_type == "sql" else "Uncategorized")
-            
-            items.append({
-                "id": header["id"], "title": header["title"], "slug": header["slug"],
-                "idea": header["idea"], "time": header["time"], "space": header["space"],
-                "tags": tags, "link": header["link"] or meta.get("link"),
-                "difficulty": meta.get("difficulty", ""), "category": category,
-                "track": track["key"], "type": file_type,
-                "path": str(path.relative_to(ROOT)).replace("\\", "/")
-            })
+            item = build_index_item(track, path, plan_meta, file_type)
+            if item:
+                items.append(item)
         except (IOError, UnicodeDecodeError) as e:
             print(f"Warning: Failed to process {path}: {e}")
             continue
     return items
 
+def write_index_dataset(items: list[dict]) -> None:
+    """Sort items, derive the filter lists and write the UI dataset."""
+    items.sort(key=lambda x: (x["track"], x["type"], x["id"]))
+
+    # Generate aggregated data
+    tracks_list = sorted({item["track"] for item in items})
+    tags_list = sorted({tag for item in items for tag in item["tags"]})
+    cats_list = sorted({item["category"] for item in items if item.get("category")})
+
+    # Write index file
+    INDEX_JSON.parent.mkdir(parents=True, exist_ok=True)
+    index_data = {
+        "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "tracks": tracks_list,
+        "tags": tags_list,
+        "categories": cats_list,
+        "items": items
+    }
+    atomic_write_text(INDEX_JSON, json.dumps(index_data, indent=2))
+
+def collect_index_items(tracks: list[dict], plan_meta: dict) -> list[dict]:
+    """Parse every solution file of every track into index items."""
+    items = []
+    for track in tracks:
+        items.extend(process_track_files(track, plan_meta, "py"))
+        items.extend(process_track_files(track, plan_meta, "sql"))
+    return items
+
 def rebuild_index_dataset(tracks: list[dict]):
     """Rebuild the index dataset for the UI."""
     try:
-        plan_meta = load_plans_all()
-        items = []
-        
-        for track in tracks:
-            items.extend(process_track_files(track, plan_meta, "py"))
-            items.extend(process_track_files(track, plan_meta, "sql"))
-        
-        items.sort(key=lambda x: (x["track"], x["type"], x["id"]))
-        
-        # Generate aggregated data
-        tracks_list = sorted({item["track"] for item in items})
-        tags_list = sorted({tag for item in items for tag in item["tags"]})
-        cats_list = sorted({item["category"] for item in items if item.get("category")})
-        
-        # Write index file
-        INDEX_JSON.parent.mkdir(parents=True, exist_ok=True)
-        index_data = {
-            "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            "tracks": tracks_list,
-            "tags": tags_list,
-            "categories": cats_list,
-            "items": items
-        }
-        INDEX_JSON.write_text(json.dumps(index_data, indent=2), encoding="utf-8")
+        items = collect_index_items(tracks, load_plans_all())
+        with outputs_lock():
+            write_index_dataset(items)
         
     except Exception as e:
         print(f"Error rebuilding index dataset: {e}")
         raise SystemExit(1)
 
-if __name__ == "__main__":
-    try:
-        # Load registry configuration
-        registry_data = json.loads(REGISTRY.read_text(encoding="utf-8"))
-        tracks = registry_data["tracks"]
+def load_registry() -> list[dict]:
+    """Load track definitions from the registry."""
+    return json.loads(REGISTRY.read_text(encoding="utf-8"))["tracks"]
 
-        # Build plans and checklists for each track
-        for track in tracks:
-            csv_path = ROOT / track["csv"]
-            items = parse_csv(csv_path)
+def sync_track(track_key: str, *solution_paths: Path) -> list[Path]:
+    """
+    Incrementally sync a single track: its plan JSON and checklist, its
+    membership in the problem catalog, its README marker, and the index
+    entries for the given solution files.
+    Returns the paths that were written.
+    """
+    tracks = load_registry()
+    track = next((t for t in tracks if t["key"] == track_key), None)
+    if track is None:
+        raise KeyError(f"Unknown track: {track_key}")
+
+    written = []
+    solutions = scan_all_solutions(tracks)
+    with track_lock(track_key):
+        items = parse_csv(ROOT / track["csv"])
+        if items:
+            write_plan_and_checklist(track, items, set(solutions))
+            written += [ROOT / track["plan_json"], ROOT / track["checklist_md"], progress_log.log_path(track_key)]
+
+        # Shared outputs: read-modify-write under the outputs lock
+        with outputs_lock():
             if items:
-                write_plan_and_checklist(track, items)
-            else:
-                print(f"Warning: No items found for track {track['key']}")
+                catalog = load_problem_catalog()
+                catalog["tracks"][track_key] = [{"id": item["id"], "category": item["category"]} for item in items]
+                for item in items:
+                    merge_problem(catalog["problems"], item)
+                catalog["problems"] = dict(sorted(catalog["problems"].items(), key=lambda kv: int(kv[0])))
+                catalog["solutions"] = catalog_solutions(catalog["problems"], solutions)
+                write_problem_catalog(catalog)
+                update_readme_progress([track])
+                written += [PROBLEMS_JSON, README]
+
+            if solution_paths:
+                plan_meta = load_plans_all()
+                new_items = {}
+                for solution_path in solution_paths:
+                    solution_path = Path(solution_path).resolve()
+                    file_type = "sql" if solution_path.suffix == ".sql" else "py"
+                    item = build_index_item(track, solution_path, plan_meta, file_type)
+                    if item:
+                        new_items[item["path"]] = item
+
+                try:
+                    index_items = json.loads(INDEX_JSON.read_text(encoding="utf-8")).get("items", [])
+                except (FileNotFoundError, json.JSONDecodeError):
+                    index_items = []
+                index_items = [i for i in index_items if i.get("path") not in new_items]
+                index_items.extend(new_items.values())
+                write_index_dataset(index_items)
+                written.append(INDEX_JSON)
+
+    return written
+
+def sync_track_plan(track: dict, solved_ids: set[int]) -> list[dict]:
+    """Parse one track's CSV and write its plan/checklist under the track lock."""
+    with track_lock(track["key"]):
+        items = parse_csv(ROOT / track["csv"])
+        if items:
+            write_plan_and_checklist(track, items, solved_ids)
+    return items
+
+def sync_all(workers: int = 4) -> None:
+    """Full rebuild of every track, the problem catalog, README markers and the UI dataset."""
+    from concurrent.futures import ThreadPoolExecutor  # ~11 ms; keep it off `grind sync --help`
 
-        # Update README progress markers
-        update_readme_progress(tracks)
+    tracks = load_registry()
+    solutions = scan_all_solutions(tracks)
 
-        # Rebuild UI dataset
-        rebuild_index_dataset(tracks)
+    # Build plans and checklists for each track; independent tracks run in parallel
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda t: sync_track_plan(t, set(solutions)), tracks))
 
+    items_by_track = {}
+    for track, items in zip(tracks, results):
+        if items:
+            items_by_track[track["key"]] = items
+        else:
+            print(f"Warning: No items found for track {track['key']}")
+
+    # Normalize into the shared catalog and parse solutions outside the lock
+    catalog = build_problem_catalog(items_by_track, solutions)
+    index_items = collect_index_items(tracks, load_plans_all(catalog))
+
+    # Short critical section: only the shared writes are serialized
+    with outputs_lock():
+        write_problem_catalog(catalog)
+        update_readme_progress([t for t in tracks if t["key"] in items_by_track])
+        write_index_dataset(index_items)
+
+if __name__ == "__main__":
+    import argparse
+    p = argparse.ArgumentParser(description="Sync track plans, checklists, README progress and the UI index")
+    p.add_argument("--track", help="Only sync this track (incremental)")
+    p.add_argument("--workers", type=int, default=4, help="Tracks synced in parallel")
+    args = p.parse_args()
+    try:
+        if args.track:
+            sync_track(args.track)
+        else:
+            sync_all(args.workers)
         print("sync_all: completed successfully.")
         
     except (FileNotFoundError, json.JSONDecodeError) as e:
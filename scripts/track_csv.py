@@ -0,0 +1,122 @@
+"""
+Indexed reads and upserts for track CSVs (tracks/<track>.csv).
+The set of IDs per CSV is cached in .cache/csv_index.json and invalidated
+by the file's mtime/size, so existence checks skip re-parsing the CSV.
+"""
+from __future__ import annotations
+import csv
+import io
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHE = ROOT / ".cache/csv_index.json"
+CSV_FIELDS = ["id", "title", "slug", "difficulty", "category", "tags"]
+
+def _stamp(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+def _load_cache() -> dict:
+    try:
+        return json.loads(CACHE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def _save_cache(cache: dict) -> None:
+    try:
+        CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass
+
+def to_row(details: dict) -> dict:
+    """CSV row from wizard details (tags as the plain comma-separated string)."""
+    row = {field: details.get(field, "") for field in CSV_FIELDS}
+    if isinstance(row["tags"], list):
+        row["tags"] = ",".join(row["tags"])
+    row["tags"] = ",".join(t.strip() for t in str(row["tags"]).split(",") if t.strip())
+    row["id"] = str(int(row["id"]))
+    return row
+
+class TrackCSV:
+    """A track CSV with an O(1) ID index."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._key = str(self.path.resolve())
+        self._ids: set[int] | None = None
+
+    def ids(self) -> set[int]:
+        """IDs present in the CSV (cached between runs, keyed by mtime/size)."""
+        if self._ids is not None:
+            return self._ids
+        cache = _load_cache()
+        entry = cache.get(self._key)
+        stamp = _stamp(self.path)
+        if entry and entry.get("stamp") == stamp:
+            self._ids = set(entry["ids"])
+            return self._ids
+
+        self._ids = {int(row["id"]) for row in self.rows() if (row.get("id") or "").strip().isdigit()}
+        cache[self._key] = {"stamp": stamp, "ids": sorted(self._ids)}
+        _save_cache(cache)
+        return self._ids
+
+    def __contains__(self, problem_id: int) -> bool:
+        return int(problem_id) in self.ids()
+
+    def rows(self) -> list[dict]:
+        with self.path.open("r", encoding="utf-8", newline="") as f:
+            return list(csv.DictReader(f))
+
+    def upsert(self, entries: list[dict], replace: bool = False) -> tuple[int, int]:
+        """
+        Add rows for new IDs in one append; with replace=True, existing IDs are
+        rewritten in place. Returns (added, updated).
+        """
+        ids = self.ids()
+        new_rows, changed = {}, {}
+        for details in entries:
+            row = to_row(details)
+            pid = int(row["id"])
+            if pid in ids:
+                if replace:
+                    changed[pid] = row
+            else:
+                new_rows[pid] = row
+
+        if changed:
+            rows = self.rows()
+            for i, row in enumerate(rows):
+                pid = int(row["id"]) if (row.get("id") or "").strip().isdigit() else None
+                if pid in changed:
+                    rows[i] = changed[pid]
+            self._write_all(rows + list(new_rows.values()))
+        elif new_rows:
+            self._append(list(new_rows.values()))
+        else:
+            return 0, 0
+
+        ids.update(new_rows)
+        cache = _load_cache()
+        cache[self._key] = {"stamp": _stamp(self.path), "ids": sorted(ids)}
+        _save_cache(cache)
+        return len(new_rows), len(changed)
+
+    def _append(self, rows: list[dict]) -> None:
+        buf = io.StringIO()
+        csv.DictWriter(buf, fieldnames=CSV_FIELDS, lineterminator="\n").writerows(rows)
+        with self.path.open("rb+") as f:
+            f.seek(0, 2)
+            needs_newline = False
+            if f.tell():
+                f.seek(-1, 2)
+                needs_newline = f.read(1) != b"\n"
+            f.write((("\n" if needs_newline else "") + buf.getvalue()).encode("utf-8"))
+
+    def _write_all(self, rows: list[dict]) -> None:
+        with self.path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, lineterminator="\n", extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
+"""
+Update the README progress markers from each track's progress log.
+Usage: python scripts/update_progress.py
+"""
 from __future__ import annotations
 import re
+import argparse
 from pathlib import Path
 
+from locks import atomic_write_text, outputs_lock
+import progress_log
+
 ROOT = Path(__file__).resolve().parents[1]
 # Track configuration
 TRACK_CONFIG = {
-    "lc75": {"file": "tracks/leetcode-75.md", "total": 75, "name": "Leetcode 75"},
-    "ti150": {"file": "tracks/top-interview-150.md", "total": 150, "name": "Top Interview 150"},
-    "sql50": {"file": "tracks/sql-50.md", "total": 50, "name": "Sql 50"},
+    "lc75": {"track": "leetcode-75", "file": "tracks/leetcode-75.md", "total": 75, "name": "Leetcode 75"},
+    "ti150": {"track": "top-interview-150", "file": "tracks/top-interview-150.md", "total": 150, "name": "Top Interview 150"},
+    "sql50": {"track": "sql-50", "file": "tracks/sql-50.md", "total": 50, "name": "Sql 50"},
 }
 
 # amazonq-ignore-next-line
@@ -23,25 +31,38 @@ def count_progress(track_file: Path) -> tuple[int, int]:
         print(f"Warning: Could not read {track_file}: {e}")
         return 0, 0
 
+def track_progress(config: dict) -> tuple[int, int]:
+    """Latest counts from the progress log; re-count the checklist only if there is no log yet."""
+    last = progress_log.latest(config["track"])
+    if last is not None:
+        return last["solved"], last["total"]
+    return count_progress(ROOT / config["file"])
+
+def write_progress_markers(readme_path: Path):
+    """Rewrite the progress markers in README.md from the progress logs."""
+    readme = readme_path.read_text(encoding="utf-8")
+    
+    for key, config in TRACK_CONFIG.items():
+        done, total = track_progress(config)
+        total = total or config["total"]
+        pct = int(round((done / total) * 100)) if total else 0
+        
+        pattern = re.compile(
+            rf"(<!-- PROGRESS:{key}:start -->)(.*?)(<!-- PROGRESS:{key}:end -->)", 
+            re.S | re.I
+        )
+        replacement = rf"\1{config['name']}: {done}/{total} ({pct}%)\3"
+        readme = pattern.sub(replacement, readme)
+    
+    atomic_write_text(readme_path, readme)
+
 def update_readme():
     """Update progress markers in README.md."""
     readme_path = ROOT / "README.md"
     try:
-        readme = readme_path.read_text(encoding="utf-8")
-        
-        for key, config in TRACK_CONFIG.items():
-            done, total = count_progress(ROOT / config["file"])
-            total = total or config["total"]
-            pct = int(round((done / total) * 100)) if total else 0
-            
-            pattern = re.compile(
-                rf"(<!-- PROGRESS:{key}:start -->)(.*?)(<!-- PROGRESS:{key}:end -->)", 
-                re.S | re.I
-            )
-            replacement = rf"\1{config['name']}: {done}/{total} ({pct}%)\3"
-            readme = pattern.sub(replacement, readme)
-        
-        readme_path.write_text(readme, encoding="utf-8")
+        # README is shared with sync_all/daily; serialize the read-modify-write
+        with outputs_lock():
+            write_progress_markers(readme_path)
         print("README progress updated.")
         
     except (FileNotFoundError, PermissionError) as e:
@@ -49,6 +70,7 @@ def update_readme():
         raise SystemExit(1)
 
 if __name__ == "__main__":
+    argparse.ArgumentParser(description="Update the README progress markers").parse_args()
     try:
         update_readme()
     except Exception as e:
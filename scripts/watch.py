@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Keep an interpreter warm and re-run a solution's cases every time it is saved.
+Polls python/** for changed solutions or .cases.json sidecars, re-executes only
+the changed module and streams the results.
+Usage: python scripts/watch.py [paths...] [--interval 0.02] [--timeout 2]
+"""
+from __future__ import annotations
+import argparse
+import sys
+import time
+import types
+from pathlib import Path
+
+from run_tests import (DEFAULT_TIMEOUT, PYTHON_DIR, cases_path, discover, display_path, load_cases, resolve_method,
+                       run_case, solution_globals)
+
+def load_fresh(path: Path) -> types.ModuleType:
+    """Re-execute a solution from source.
+    Compiling directly (instead of importlib.reload / the .pyc cache) means two
+    saves within the same second are never served stale bytecode."""
+    name = f"solution_{path.stem.replace('-', '_')}"
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    module.__dict__.update(solution_globals(path))
+    sys.modules[name] = module
+    code = compile(path.read_bytes(), str(path), "exec")
+    exec(code, module.__dict__)
+    return module
+
+def snapshot(paths: list[Path]) -> dict[Path, tuple[int, int]]:
+    """(mtime_ns, size) of every watched solution and its sidecar."""
+    stamps = {}
+    for solution in discover(paths):
+        for f in (solution, cases_path(solution)):
+            try:
+                st = f.stat()
+                stamps[f] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                pass
+    return stamps
+
+def solution_for(changed: Path) -> Path:
+    if changed.name.endswith(".cases.json"):
+        return changed.with_name(changed.name[:-len(".cases.json")] + ".py")
+    return changed
+
+def run(solution: Path, timeout: float, saved_ns: int) -> None:
+    rel = display_path(solution)
+    if not cases_path(solution).exists():
+        print(f"⚪ {rel}: no {cases_path(solution).name}")
+        return
+    try:
+        spec = load_cases(solution)
+        module = load_fresh(solution)
+        method = resolve_method(module.Solution, spec.get("method"))
+    except Exception as e:
+        print(f"💥 {rel}: {type(e).__name__}: {e}")
+        return
+
+    cases = spec.get("cases", [])
+    passed = 0
+    for i, case in enumerate(cases):
+        result = run_case(module.Solution, method, case, timeout, spec.get("structures"), spec.get("returns"))
+        if result["status"] == "pass":
+            passed += 1
+            print(f"   ✓ case {i}  {result['ms']:.3f} ms")
+        elif result["status"] == "fail":
+            print(f"   ✗ case {i}  expected {result['expected']!r}, got {result['got']!r}")
+        elif result["status"] == "timeout":
+            print(f"   ⏱ case {i}  timed out after {timeout:g}s")
+        else:
+            print(f"   💥 case {i}  {result['error']}")
+    latency = (time.time_ns() - saved_ns) / 1e6
+    mark = "✅" if passed == len(cases) else "❌"
+    print(f"{mark} {rel}  {passed}/{len(cases)}  (save → result {latency:.1f} ms)\n")
+
+def main():
+    p = argparse.ArgumentParser(description="Re-run a solution's cases on every save")
+    p.add_argument("paths", nargs="*", type=Path, help="Files or directories to watch (default: python/)")
+    p.add_argument("--interval", type=float, default=0.02, help="Poll interval in seconds")
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-case timeout in seconds")
+    args = p.parse_args()
+
+    paths = args.paths or [PYTHON_DIR]
+    stamps = snapshot(paths)
+    print(f"👀 Watching {len(stamps)} files (Ctrl+C to stop)\n")
+    try:
+        while True:
+            time.sleep(args.interval)
+            current = snapshot(paths)
+            changed = [f for f, stamp in current.items() if stamps.get(f) != stamp]
+            stamps = current
+            if not changed:
+                continue
+            saved_ns = max(current[f][0] for f in changed)
+            for solution in dict.fromkeys(solution_for(f) for f in changed):
+                if solution.exists():
+                    run(solution, args.timeout, saved_ns)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+if __name__ == "__main__":
+    main()